@@ -1,49 +1,62 @@
 import asyncio
-import inspect
 import os
-import platform
 import signal
 import socket
 import sys
-import time
+import threading
 import warnings
 from contextlib import suppress
+from functools import lru_cache
 from ipaddress import ip_address
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-import httpx
 import typer
-from dotenv import load_dotenv
-from fastapi import HTTPException
-from httpx import HTTPError
-from jose import JWTError
 from lfx.log.logger import configure, logger
 from lfx.services.settings.constants import DEFAULT_SUPERUSER, DEFAULT_SUPERUSER_PASSWORD
-from multiprocess import cpu_count
-from multiprocess.context import Process
-from packaging import version as pkg_version
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from sqlmodel import select
-
-from langflow.cli.progress import create_langflow_progress
-from langflow.initial_setup.setup import get_or_create_default_folder
-from langflow.main import setup_app
+
 from langflow.services.auth.utils import check_key, get_current_user_by_jwt
 from langflow.services.deps import get_db_service, get_settings_service, is_settings_service_initialized, session_scope
-from langflow.services.utils import initialize_services
-from langflow.utils.version import fetch_latest_version, get_version_info
-from langflow.utils.version import is_pre_release as langflow_is_pre_release
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# sys.platform is fixed at interpreter build time, so these never change during the process lifetime
+_IS_WINDOWS = sys.platform.startswith("win")
+_IS_DARWIN = sys.platform == "darwin"
 
 app = typer.Typer(no_args_is_help=True)
-console = Console()
-if platform.system() == "Windows":
-    console = Console(legacy_windows=True, emoji=False)  # Initialize console with Windows-safe settings
+if _IS_WINDOWS:
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # type: ignore[attr-defined]
 
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Return the shared rich console, creating it on first use."""
+    from rich.console import Console
+
+    if _IS_WINDOWS:
+        return Console(legacy_windows=True, emoji=False)  # Initialize console with Windows-safe settings
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def _get_version_info() -> dict:
+    """Return the installed Langflow version info, resolved once per process."""
+    from langflow.utils.version import get_version_info
+
+    return get_version_info()
+
+
+@lru_cache(maxsize=16)
+def langflow_is_pre_release(version: str) -> bool:
+    """Whether the given Langflow version is a pre-release, memoized per version string."""
+    from langflow.utils.version import is_pre_release
+
+    return is_pre_release(version)
+
+
 # Add LFX commands as a sub-app
 try:
     from lfx.cli.commands import serve_command
@@ -64,8 +77,9 @@ class ProcessManager:
 
     def __init__(self):
         self.webapp_process = None
-        self.shutdown_in_progress = False
-        if platform.system() == "Windows":
+        # Set from the signal handlers; the main thread performs the actual shutdown
+        self.shutdown_requested = threading.Event()
+        if _IS_WINDOWS:
             self._farewell_emoji = ":)"  # ASCII smiley
         else:
             self._farewell_emoji = "👋"  # Unicode wave
@@ -73,18 +87,27 @@ class ProcessManager:
     # params are required for signal handlers, even if they are not used
     def handle_sigterm(self, _signum: int, _frame) -> None:
         """Handle SIGTERM signal gracefully."""
-        if self.shutdown_in_progress:
-            return  # Already shutting down, ignore
-        self.shutdown_in_progress = True
-        self.shutdown()
+        self.request_shutdown()
 
     # params are required for signal handlers, even if they are not used
     def handle_sigint(self, _signum: int, _frame) -> None:
         """Handle SIGINT signal gracefully."""
-        if self.shutdown_in_progress:
+        self.request_shutdown()
+
+    def request_shutdown(self) -> None:
+        """Record a shutdown request without doing any work inside the signal handler."""
+        if self.shutdown_requested.is_set():
             return  # Already shutting down, ignore
-        self.shutdown_in_progress = True
-        self.shutdown()
+        self.shutdown_requested.set()
+        if self.webapp_process is None:
+            # Nothing is supervised yet, so there is no main loop to hand the shutdown to
+            sys.exit(0)
+
+    def wait(self, poll_interval: float = 1.0) -> None:
+        """Block until a shutdown is requested or the webapp process exits on its own."""
+        while not self.shutdown_requested.wait(timeout=poll_interval):
+            if self.webapp_process is None or not self.webapp_process.is_alive():
+                return
 
     def shutdown(self):
         """Gracefully shutdown the webapp process."""
@@ -124,15 +147,48 @@ signal.signal(signal.SIGTERM, process_manager.handle_sigterm)
 signal.signal(signal.SIGINT, process_manager.handle_sigint)
 
 
+# Rough resident footprint of one worker once the component libraries are loaded
+WORKER_MEMORY_BYTES = 1536 * 1024 * 1024
+_CGROUP_MEMORY_LIMIT_FILES = (
+    Path("/sys/fs/cgroup/memory.max"),  # cgroup v2
+    Path("/sys/fs/cgroup/memory/memory.limit_in_bytes"),  # cgroup v1
+)
+
+
+def get_total_memory_bytes() -> int | None:
+    """Return the memory available to this process, honoring container limits when present."""
+    try:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None  # os.sysconf is unavailable on Windows
+    for limit_file in _CGROUP_MEMORY_LIMIT_FILES:
+        try:
+            limit = limit_file.read_text().strip()
+        except OSError:
+            continue
+        if limit.isdigit():
+            total = min(total, int(limit))
+        break
+    return total
+
+
 def get_number_of_workers(workers=None):
     if workers == -1 or workers is None:
-        workers = (cpu_count() * 2) + 1
+        # cpu_count + 1 rather than the classic 2 * cpu_count + 1: each worker loads the full
+        # component graph, so memory runs out long before CPU on many-core hosts
+        workers = (os.cpu_count() or 1) + 1
+        total_memory = get_total_memory_bytes()
+        if total_memory is not None:
+            workers = max(1, min(workers, total_memory // WORKER_MEMORY_BYTES))
     logger.debug(f"Number of workers: {workers}")
     return workers
 
 
 def display_results(results) -> None:
     """Display the results of the migration."""
+    from rich.table import Table
+
+    console = get_console()
     for table_results in results:
         table = Table(title=f"Migration {table_results.table_name}")
         table.add_column("Name")
@@ -144,8 +200,7 @@ def display_results(results) -> None:
             color = "green" if result.success else "red"
             table.add_row(result.name, result.type, f"[{color}]{status}[/{color}]")
 
-        console.print(table)
-        console.print()  # Print a new line
+        console.print(table, end="\n\n")  # Trailing blank line in the same write
 
 
 def set_var_for_macos_issue() -> None:
@@ -153,32 +208,46 @@ def set_var_for_macos_issue() -> None:
     # we need to set this var is we are running on MacOS
     # otherwise we get an error when running gunicorn
 
-    if platform.system() == "Darwin":
-        import os
+    if not _IS_DARWIN:
+        return
 
+    # Only write when the value differs; the launcher usually sets both before exec
+    if os.environ.get("OBJC_DISABLE_INITIALIZE_FORK_SAFETY") != "YES":
         os.environ["OBJC_DISABLE_INITIALIZE_FORK_SAFETY"] = "YES"
-        # https://stackoverflow.com/questions/75747888/uwsgi-segmentation-fault-with-flask-python-app-behind-nginx-after-running-for-2 # noqa: E501
-        os.environ["no_proxy"] = "*"  # to avoid error with gunicorn
         logger.debug("Set OBJC_DISABLE_INITIALIZE_FORK_SAFETY to YES to avoid error")
+    # https://stackoverflow.com/questions/75747888/uwsgi-segmentation-fault-with-flask-python-app-behind-nginx-after-running-for-2
+    if os.environ.get("no_proxy") != "*":
+        os.environ["no_proxy"] = "*"  # to avoid error with gunicorn
+
+
+HEALTH_CHECK_INITIAL_DELAY = 0.05  # seconds
+HEALTH_CHECK_MAX_DELAY = 1.0  # seconds
 
 
 def wait_for_server_ready(host, port, protocol) -> None:
     """Wait for the server to become ready by polling the health endpoint."""
+    import httpx
+    from httpx import HTTPError
+
     # Use localhost for health check when host is 0.0.0.0 (bind to all interfaces)
     health_check_host = "localhost" if host == "0.0.0.0" else host  # noqa: S104
 
-    status_code = 0
-    while status_code != httpx.codes.OK:
-        try:
-            status_code = httpx.get(
-                f"{protocol}://{health_check_host}:{port}/health",
-                verify=health_check_host not in ("127.0.0.1", "localhost"),
-            ).status_code
-        except HTTPError:
-            time.sleep(1)
-        except Exception:  # noqa: BLE001
-            logger.debug("Error while waiting for the server to become ready.", exc_info=True)
-            time.sleep(1)
+    health_url = f"{protocol}://{health_check_host}:{port}/health"
+    delay = HEALTH_CHECK_INITIAL_DELAY
+    with httpx.Client(verify=health_check_host not in ("127.0.0.1", "localhost"), timeout=1.0) as client:
+        while True:
+            # A bare TCP connect is far cheaper than an HTTP request while the server is still booting
+            if is_port_in_use(port, health_check_host):
+                try:
+                    if client.get(health_url).status_code == httpx.codes.OK:
+                        return
+                except HTTPError:
+                    pass
+                except Exception:  # noqa: BLE001
+                    logger.debug("Error while waiting for the server to become ready.", exc_info=True)
+            if process_manager.shutdown_requested.wait(delay):
+                return
+            delay = min(delay * 2, HEALTH_CHECK_MAX_DELAY)
 
 
 @app.command()
@@ -206,12 +275,12 @@ def run(
     ),
     log_file: Path | None = typer.Option(None, help="Path to the log file.", show_default=False),
     log_rotation: str | None = typer.Option(None, help="Log rotation(Time/Size).", show_default=False),
-    cache: str | None = typer.Option(  # noqa: ARG001
+    cache: str | None = typer.Option(
         None,
         help="Type of cache to use. (InMemoryCache, SQLiteCache)",
         show_default=False,
     ),
-    dev: bool | None = typer.Option(None, help="Run in development mode (may contain bugs)", show_default=False),  # noqa: ARG001
+    dev: bool | None = typer.Option(None, help="Run in development mode (may contain bugs)", show_default=False),
     frontend_path: str | None = typer.Option(
         None,
         help="Path to the frontend directory containing build files. This is for development purposes only.",
@@ -222,7 +291,7 @@ def run(
         help="Open the browser after starting the server.",
         show_default=False,
     ),
-    remove_api_keys: bool | None = typer.Option(  # noqa: ARG001
+    remove_api_keys: bool | None = typer.Option(
         None,
         help="Remove API keys from the projects saved in the database.",
         show_default=False,
@@ -232,32 +301,32 @@ def run(
         help="Run only the backend server without the frontend.",
         show_default=False,
     ),
-    store: bool | None = typer.Option(  # noqa: ARG001
+    store: bool | None = typer.Option(
         None,
         help="Enables the store features.",
         show_default=False,
     ),
-    auto_saving: bool | None = typer.Option(  # noqa: ARG001
+    auto_saving: bool | None = typer.Option(
         None,
         help="Defines if the auto save is enabled.",
         show_default=False,
     ),
-    auto_saving_interval: int | None = typer.Option(  # noqa: ARG001
+    auto_saving_interval: int | None = typer.Option(
         None,
         help="Defines the debounce time for the auto save.",
         show_default=False,
     ),
-    health_check_max_retries: bool | None = typer.Option(  # noqa: ARG001
+    health_check_max_retries: bool | None = typer.Option(
         None,
         help="Defines the number of retries for the health check.",
         show_default=False,
     ),
-    max_file_size_upload: int | None = typer.Option(  # noqa: ARG001
+    max_file_size_upload: int | None = typer.Option(
         None,
         help="Defines the maximum file size for the upload in MB.",
         show_default=False,
     ),
-    webhook_polling_interval: int | None = typer.Option(  # noqa: ARG001
+    webhook_polling_interval: int | None = typer.Option(
         None,
         help="Defines the polling interval for the webhook.",
         show_default=False,
@@ -268,6 +337,11 @@ def run(
     ssl_key_file_path: str | None = typer.Option(None, help="Defines the SSL key file path.", show_default=False),
 ) -> None:
     """Run Langflow."""
+    from dotenv import load_dotenv
+
+    from langflow.cli.progress import create_langflow_progress
+    from langflow.main import setup_app
+
     if env_file:
         if is_settings_service_initialized():
             err = (
@@ -297,24 +371,49 @@ def run(
 
     # Step 1: Checking Environment
     with progress.step(1):
+        auth_attrs = frozenset(dir(settings_service.auth_settings))
+        prefix = "LANGFLOW_"
         for key, value in os.environ.items():
-            new_key = key.replace("LANGFLOW_", "")
-            if hasattr(settings_service.auth_settings, new_key):
+            if not key.startswith(prefix):
+                continue
+            new_key = key[len(prefix) :]
+            if new_key in auth_attrs:
                 setattr(settings_service.auth_settings, new_key, value)
 
-        frame = inspect.currentframe()
-        valid_args: list = []
-        values: dict = {}
-        if frame is not None:
-            arguments, _, _, values = inspect.getargvalues(frame)
-            valid_args = [arg for arg in arguments if values[arg] is not None]
-
+        values = {
+            "host": host,
+            "workers": workers,
+            "worker_timeout": worker_timeout,
+            "port": port,
+            "components_path": components_path,
+            "env_file": env_file,
+            "log_level": log_level,
+            "log_file": log_file,
+            "log_rotation": log_rotation,
+            "cache": cache,
+            "dev": dev,
+            "frontend_path": frontend_path,
+            "open_browser": open_browser,
+            "remove_api_keys": remove_api_keys,
+            "backend_only": backend_only,
+            "store": store,
+            "auto_saving": auto_saving,
+            "auto_saving_interval": auto_saving_interval,
+            "health_check_max_retries": health_check_max_retries,
+            "max_file_size_upload": max_file_size_upload,
+            "webhook_polling_interval": webhook_polling_interval,
+            "ssl_cert_file_path": ssl_cert_file_path,
+            "ssl_key_file_path": ssl_key_file_path,
+        }
+        valid_args = [arg for arg, value in values.items() if value is not None]
+
+        settings_attrs = frozenset(dir(settings_service.settings))
         for arg in valid_args:
             if arg == "components_path":
                 settings_service.settings.update_settings(components_path=components_path)
-            elif hasattr(settings_service.settings, arg):
+            elif arg in settings_attrs:
                 settings_service.set(arg, values[arg])
-            elif hasattr(settings_service.auth_settings, arg):
+            elif arg in auth_attrs:
                 settings_service.auth_settings.set(arg, values[arg])
             logger.debug(f"Loading config from cli parameter '{arg}': '{values[arg]}'")
 
@@ -341,11 +440,10 @@ def run(
     # Step 3: Connecting Database (this happens inside setup_app via dependencies)
     with progress.step(3):
         # check if port is being used
-        if is_port_in_use(port, host):
-            port = get_free_port(port)
+        port = get_free_port(port, host)
 
         # Store the runtime-detected port in settings (temporary until strict port enforcement)
-        get_settings_service().settings.runtime_port = port
+        settings_service.settings.runtime_port = port
 
         protocol = "https" if ssl_cert_file_path and ssl_key_file_path else "http"
 
@@ -354,12 +452,12 @@ def run(
         pass  # Components are loaded during app startup
 
     # Step 5: Adding Starter Projects (placeholder for starter projects)
-    if get_settings_service().settings.create_starter_projects:
+    if settings_service.settings.create_starter_projects:
         with progress.step(5):
             pass  # Starter projects are added during app startup
 
     # Step 6: Launching Langflow
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         with progress.step(6):
             import uvicorn
 
@@ -382,6 +480,8 @@ def run(
     else:
         with progress.step(6):
             # Use Gunicorn with LangflowUvicornWorker for non-Windows systems
+            from multiprocess.context import Process
+
             from langflow.server import LangflowApplication
 
             options = {
@@ -400,16 +500,17 @@ def run(
 
             wait_for_server_ready(host, port, protocol)
 
-        # Print summary and banner after server is ready
-        progress.print_summary()
-        print_banner(str(host), int(port or 7860), protocol)
+        if not process_manager.shutdown_requested.is_set():
+            # Print summary and banner after server is ready
+            progress.print_summary()
+            print_banner(str(host), int(port or 7860), protocol)
 
-        # Handle browser opening
-        if open_browser and not backend_only:
-            click.launch(f"{protocol}://{host}:{port}")
+            # Handle browser opening
+            if open_browser and not backend_only:
+                click.launch(f"{protocol}://{host}:{port}")
 
         try:
-            process_manager.webapp_process.join()
+            process_manager.wait()
         except KeyboardInterrupt:
             # SIGINT should be handled by the signal handler, but leaving here for safety
             logger.warning("KeyboardInterrupt caught in main thread")
@@ -431,18 +532,25 @@ def is_port_in_use(port, host="localhost"):
         return s.connect_ex((host, port)) == 0
 
 
-def get_free_port(port):
-    """Given a used port, find a free port.
+def get_free_port(port, host="localhost"):
+    """Return the preferred port if it can be bound, otherwise a free port assigned by the kernel.
 
     Args:
-        port (int): The port number to check.
+        port (int): The preferred port number.
+        host (str): The host the server will bind to. Defaults to 'localhost'.
 
     Returns:
         int: A free port number.
     """
-    while is_port_in_use(port):
-        port += 1
-    return port
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        if not _IS_WINDOWS:
+            # Ignore sockets lingering in TIME_WAIT, matching how the server itself binds
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind((host, port))
+        except OSError:
+            s.bind((host, 0))
+        return s.getsockname()[1]
 
 
 def is_loopback_address(host: str) -> bool:
@@ -509,17 +617,26 @@ def get_best_access_host(host: str, port: int) -> str:
     return "localhost"
 
 
+# "rc" is checked first so a release candidate is never reported by a stray letter
+_PRE_RELEASE_LETTERS = ("rc", "a", "b")
+
+
 def get_letter_from_version(version: str) -> str | None:
     """Get the letter from a pre-release version."""
-    if "a" in version:
-        return "a"
-    if "b" in version:
-        return "b"
-    if "rc" in version:
-        return "rc"
+    for letter in _PRE_RELEASE_LETTERS:
+        if letter in version:
+            return letter
     return None
 
 
+@lru_cache(maxsize=128)
+def _parse_version(version: str):
+    """Parse a PEP 440 version string, memoized so repeated comparisons skip the regex match."""
+    from packaging.version import parse
+
+    return parse(version)
+
+
 def build_version_notice(current_version: str, package_name: str) -> str:
     """Build a version notice message if a newer version is available.
 
@@ -538,9 +655,17 @@ def build_version_notice(current_version: str, package_name: str) -> str:
         >>> build_version_notice("1.0.0", "langflow")
         'A new version of langflow is available: 1.1.0'
     """
+    import httpx
+
+    from langflow.utils.version import fetch_latest_version
+
     with suppress(httpx.ConnectError):
         latest_version = fetch_latest_version(package_name, include_prerelease=langflow_is_pre_release(current_version))
-        if latest_version and pkg_version.parse(current_version) < pkg_version.parse(latest_version):
+        if (
+            latest_version
+            and latest_version != current_version
+            and _parse_version(current_version) < _parse_version(latest_version)
+        ):
             release_type = "pre-release" if langflow_is_pre_release(latest_version) else "version"
             return f"A new {release_type} of {package_name} is available: {latest_version}"
     return ""
@@ -561,21 +686,47 @@ def stylize_text(text: str, to_style: str, *, is_prerelease: bool) -> str:
     return text.replace(to_style, styled_text)
 
 
+# Use Windows-safe characters to prevent encoding issues
+if _IS_WINDOWS:
+    _GITHUB_ICON, _DISCORD_ICON, _ARROW, _STATUS_ICON = "*", "#", "->", "[OK]"
+else:
+    _GITHUB_ICON, _DISCORD_ICON, _ARROW, _STATUS_ICON = ":star2:", ":speech_balloon:", "→", "🟢"
+
+# Static banner sections, built once; print_banner only fills in the version title and access link
+_BANNER_INFO_TEXT = (
+    f"{_GITHUB_ICON} GitHub: Star for updates {_ARROW} https://github.com/langflow-ai/langflow\n"
+    f"{_DISCORD_ICON} Discord: Join for support {_ARROW} https://discord.com/invite/EqksyE2EX9"
+)
+_BANNER_TELEMETRY_ENABLED_TEXT = (
+    "We collect anonymous usage data to improve Langflow.\n"
+    "To opt out, set: [bold]DO_NOT_TRACK=true[/bold] in your environment."
+)
+_BANNER_TELEMETRY_DISABLED_TEXT = (
+    "We are [bold]not[/bold] collecting anonymous usage data to improve Langflow.\n"
+    "To contribute, set: [bold]DO_NOT_TRACK=false[/bold] in your environment."
+)
+_BANNER_ACCESS_PREFIX = f"[bold]{_STATUS_ICON} Open Langflow {_ARROW}[/bold]"
+
+
 def print_banner(host: str, port: int, protocol: str) -> None:
+    from rich.panel import Panel
+
+    console = get_console()
     notices = []
     package_names = []  # Track package names for pip install instructions
     is_pre_release = False  # Track if any package is a pre-release
     package_name = ""
 
     # Use langflow.utils.version to get the version info
-    version_info = get_version_info()
+    version_info = _get_version_info()
     langflow_version = version_info["version"]
     package_name = version_info["package"]
     is_pre_release |= langflow_is_pre_release(langflow_version)  # Update pre-release status
+    styled_package_name = stylize_text(package_name, package_name, is_prerelease=is_pre_release)
 
     notice = build_version_notice(langflow_version, package_name)
-
-    notice = stylize_text(notice, package_name, is_prerelease=is_pre_release)
+    # Reuse the styled name instead of re-styling the whole notice text
+    notice = notice.replace(package_name, styled_package_name)
     if notice:
         notices.append(notice)
     package_names.append(package_name)
@@ -587,46 +738,19 @@ def print_banner(host: str, port: int, protocol: str) -> None:
     if notices:
         notices.append(f"Run '{pip_command}' to update.")
 
-    [f"[bold]{notice}[/bold]" for notice in notices if notice]
-    styled_package_name = stylize_text(
-        package_name, package_name, is_prerelease=any("pre-release" in notice for notice in notices)
-    )
-
     title = f"[bold]Welcome to {styled_package_name}[/bold]\n"
 
-    # Use Windows-safe characters to prevent encoding issues
-    import platform
-
-    if platform.system() == "Windows":
-        github_icon = "*"
-        discord_icon = "#"
-        arrow = "->"
-        status_icon = "[OK]"
-    else:
-        github_icon = ":star2:"
-        discord_icon = ":speech_balloon:"
-        arrow = "→"
-        status_icon = "🟢"
-
-    info_text = (
-        f"{github_icon} GitHub: Star for updates {arrow} https://github.com/langflow-ai/langflow\n"
-        f"{discord_icon} Discord: Join for support {arrow} https://discord.com/invite/EqksyE2EX9"
-    )
     telemetry_text = (
-        (
-            "We collect anonymous usage data to improve Langflow.\n"
-            "To opt out, set: [bold]DO_NOT_TRACK=true[/bold] in your environment."
-        )
+        _BANNER_TELEMETRY_ENABLED_TEXT
         if os.getenv("DO_NOT_TRACK", os.getenv("LANGFLOW_DO_NOT_TRACK", "False")).lower() != "true"
-        else (
-            "We are [bold]not[/bold] collecting anonymous usage data to improve Langflow.\n"
-            "To contribute, set: [bold]DO_NOT_TRACK=false[/bold] in your environment."
-        )
+        else _BANNER_TELEMETRY_DISABLED_TEXT
     )
     access_host = get_best_access_host(host, port)
-    access_link = f"[bold]{status_icon} Open Langflow {arrow}[/bold] [link={protocol}://{access_host}:{port}]{protocol}://{access_host}:{port}[/link]"
+    access_link = (
+        f"{_BANNER_ACCESS_PREFIX} [link={protocol}://{access_host}:{port}]{protocol}://{access_host}:{port}[/link]"
+    )
 
-    message = f"{title}\n{info_text}\n\n{telemetry_text}\n\n{access_link}"
+    message = f"{title}\n{_BANNER_INFO_TEXT}\n\n{telemetry_text}\n\n{access_link}"
 
     # Handle Unicode encoding errors on Windows
     try:
@@ -677,6 +801,13 @@ def superuser(
 
 async def _create_superuser(username: str, password: str, auth_token: str | None):
     """Create a superuser."""
+    from fastapi import HTTPException
+    from jose import JWTError
+    from sqlmodel import select
+
+    from langflow.initial_setup.setup import get_or_create_default_folder
+    from langflow.services.utils import initialize_services
+
     await initialize_services()
 
     settings_service = get_settings_service()
@@ -806,24 +937,32 @@ def copy_db() -> None:
     from platformdirs import user_cache_dir
 
     cache_dir = Path(user_cache_dir("langflow"))
-    db_path = cache_dir / "langflow.db"
-    pre_db_path = cache_dir / "langflow-pre.db"
+    db_name = "langflow.db"
+    pre_db_name = "langflow-pre.db"
+    # A single directory listing replaces one stat call per database file
+    try:
+        with os.scandir(cache_dir) as entries:
+            cached_files = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        cached_files = set()
     # It should be copied to the current directory
     # this file is __main__.py and it should be in the same directory as the database
     destination_folder = Path(__file__).parent
-    if db_path.exists():
-        shutil.copy(db_path, destination_folder)
+    if db_name in cached_files:
+        shutil.copyfile(cache_dir / db_name, destination_folder / db_name)
         typer.echo(f"Database copied to {destination_folder}")
     else:
         typer.echo("Database not found in the cache directory.")
-    if pre_db_path.exists():
-        shutil.copy(pre_db_path, destination_folder)
+    if pre_db_name in cached_files:
+        shutil.copyfile(cache_dir / pre_db_name, destination_folder / pre_db_name)
         typer.echo(f"Pre-release database copied to {destination_folder}")
     else:
         typer.echo("Pre-release database not found in the cache directory.")
 
 
 async def _migration(*, test: bool, fix: bool) -> None:
+    from langflow.services.utils import initialize_services
+
     await initialize_services(fix_migration=fix)
     db_service = get_db_service()
     if not test:
@@ -864,6 +1003,10 @@ def api_key(
     configure(log_level=log_level)
 
     async def aapi_key():
+        from sqlmodel import select
+
+        from langflow.services.utils import initialize_services
+
         await initialize_services()
         settings_service = get_settings_service()
         auth_settings = settings_service.auth_settings
@@ -902,7 +1045,7 @@ def api_key(
 def show_version(*, value: bool):
     if value:
         default = "DEV"
-        raw_info = get_version_info()
+        raw_info = _get_version_info()
         version = raw_info.get("version", default) if raw_info else default
         typer.echo(f"langflow {version}")
         raise typer.Exit
@@ -923,23 +1066,48 @@ def version_option(
     pass
 
 
-def api_key_banner(unmasked_api_key) -> None:
-    is_mac = platform.system() == "Darwin"
-    import pyperclip
+def copy_to_clipboard(text: str) -> bool:
+    """Copy text to the system clipboard, returning whether it succeeded.
 
-    pyperclip.copy(unmasked_api_key.api_key)
+    Skipped for non-interactive output, where pyperclip would shell out to a clipboard tool
+    that is usually missing (or hangs) on headless machines.
+    """
+    if not sys.stdout.isatty():
+        return False
+    try:
+        import pyperclip
+
+        pyperclip.copy(text)
+    except Exception:  # noqa: BLE001
+        logger.debug("Could not copy to the clipboard.", exc_info=True)
+        return False
+    return True
+
+
+def api_key_banner(unmasked_api_key) -> None:
+    from rich import box
+    from rich.console import Console
+    from rich.panel import Panel
+
+    is_mac = _IS_DARWIN
+    copied = copy_to_clipboard(unmasked_api_key.api_key)
+    clipboard_text = (
+        f"The API key has been copied to your clipboard. [bold]{['Ctrl', 'Cmd'][is_mac]} + V[/bold] to paste it."
+        if copied
+        else "Copy the API key above before closing this terminal."
+    )
     panel = Panel(
         f"[bold]API Key Created Successfully:[/bold]\n\n"
         f"[bold blue]{unmasked_api_key.api_key}[/bold blue]\n\n"
         "This is the only time the API key will be displayed. \n"
         "Make sure to store it in a secure location. \n\n"
-        f"The API key has been copied to your clipboard. [bold]{['Ctrl', 'Cmd'][is_mac]} + V[/bold] to paste it.",
+        f"{clipboard_text}",
         box=box.ROUNDED,
         border_style="blue",
         expand=False,
     )
     # Use Windows-safe console initialization
-    banner_console = Console(legacy_windows=True, emoji=False) if platform.system() == "Windows" else Console()
+    banner_console = Console(legacy_windows=True, emoji=False) if _IS_WINDOWS else Console()
 
     try:
         banner_console.print(panel)
@@ -949,14 +1117,16 @@ def api_key_banner(unmasked_api_key) -> None:
         logger.info(unmasked_api_key.api_key)
         logger.info("This is the only time the API key will be displayed.")
         logger.info("Make sure to store it in a secure location.")
-        ctrl_cmd = "Ctrl" if not is_mac else "Cmd"
-        logger.info(f"The API key has been copied to your clipboard. {ctrl_cmd} + V to paste it.")
+        if copied:
+            ctrl_cmd = "Ctrl" if not is_mac else "Cmd"
+            logger.info(f"The API key has been copied to your clipboard. {ctrl_cmd} + V to paste it.")
 
 
 def main() -> None:
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        app()
+    # main() owns the process, so there is no outer warnings state to restore.
+    # The filter is applied here rather than at import because langflow.main imports this module.
+    warnings.simplefilter("ignore")
+    app()
 
 
 if __name__ == "__main__":
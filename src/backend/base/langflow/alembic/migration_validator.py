@@ -40,6 +40,7 @@ class MigrationValidator:
         "INVALID_PHASE_OPERATION": "Operation not allowed in this phase",
         "NO_EXISTENCE_CHECK": "Operation should check existence first",
         "MISSING_DATA_CHECK": "CONTRACT phase should verify data migration",
+        "ASYNC_MIGRATION_FUNCTION": "upgrade()/downgrade() must be synchronous",
     }
 
     def __init__(self, *, strict_mode: bool = True):
@@ -79,6 +80,17 @@ class MigrationValidator:
                 Violation("NO_PHASE_MARKER", "Migration must specify phase: EXPAND, MIGRATE, or CONTRACT", 1)
             )
 
+        # Alembic calls upgrade()/downgrade() without awaiting them, so a coroutine would silently do nothing
+        violations.extend(
+            Violation(
+                "ASYNC_MIGRATION_FUNCTION",
+                f"{node.name}() must be a plain def; Alembic runs migrations synchronously",
+                node.lineno,
+            )
+            for node in ast.walk(tree)
+            if isinstance(node, ast.AsyncFunctionDef) and node.name in {"upgrade", "downgrade"}
+        )
+
         # Check upgrade function
         upgrade_node = self._find_function(tree, "upgrade")
         if upgrade_node:
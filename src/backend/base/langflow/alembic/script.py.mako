@@ -10,7 +10,6 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 import sqlmodel
-from sqlalchemy.engine.reflection import Inspector
 from langflow.utils import migration
 ${imports if imports else ""}
 
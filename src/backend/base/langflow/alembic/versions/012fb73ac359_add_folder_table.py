@@ -22,9 +22,8 @@ depends_on: str | Sequence[str] | None = None
 def upgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    table_names = inspector.get_table_names()
     # ### commands auto generated by Alembic - please adjust! ###
-    if "folder" not in table_names:
+    if not inspector.has_table("folder"):
         op.create_table(
             "folder",
             sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
@@ -47,7 +46,7 @@ def upgrade() -> None:
         with op.batch_alter_table("folder", schema=None) as batch_op:
             batch_op.create_index(batch_op.f("ix_folder_name"), ["name"], unique=False)
 
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    column_names = {column["name"] for column in inspector.get_columns("flow")}
     with op.batch_alter_table("flow", schema=None) as batch_op:
         if "folder_id" not in column_names:
             batch_op.add_column(sa.Column("folder_id", sqlmodel.sql.sqltypes.types.Uuid(), nullable=True))
@@ -61,9 +60,8 @@ def upgrade() -> None:
 def downgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    table_names = inspector.get_table_names()
     # ### commands auto generated by Alembic - please adjust! ###
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    column_names = {column["name"] for column in inspector.get_columns("flow")}
     with op.batch_alter_table("flow", schema=None) as batch_op:
         if "folder" not in column_names:
             batch_op.add_column(sa.Column("folder", sa.VARCHAR(), nullable=True))
@@ -76,6 +74,6 @@ def downgrade() -> None:
         with op.batch_alter_table("folder", schema=None) as batch_op:
             batch_op.drop_index(batch_op.f("ix_folder_name"))
 
-    if "folder" in table_names:
+    if inspector.has_table("folder"):
         op.drop_table("folder")
     # ### end Alembic commands ###
@@ -10,9 +10,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-import sqlmodel
-from sqlalchemy.engine.reflection import Inspector
-from langflow.utils import migration
 
 
 # revision identifiers, used by Alembic.
@@ -33,7 +30,7 @@ def upgrade() -> None:
         
         # Check if the folder table exists
         inspector = sa.inspect(conn)
-        if 'folder' not in inspector.get_table_names():
+        if not inspector.has_table('folder'):
             return
             
         # Query all folders with auth_settings
@@ -83,7 +80,7 @@ def downgrade() -> None:
         
         # Check if the folder table exists
         inspector = sa.inspect(conn)
-        if 'folder' not in inspector.get_table_names():
+        if not inspector.has_table('folder'):
             return
             
         # Query all folders with auth_settings
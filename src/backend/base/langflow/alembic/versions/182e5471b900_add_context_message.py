@@ -22,7 +22,7 @@ def upgrade() -> None:
     # Check if context_id column already exists
     bind = op.get_bind()
     inspector = sa.inspect(bind)
-    columns = [col['name'] for col in inspector.get_columns('message')]
+    columns = {col['name'] for col in inspector.get_columns('message')}
     
     # Add context_id column if it does not exist
     if 'context_id' not in columns:
@@ -33,7 +33,7 @@ def downgrade() -> None:
     # Check if context_id column exists before dropping
     bind = op.get_bind()
     inspector = sa.inspect(bind)
-    columns = [col['name'] for col in inspector.get_columns('message')]
+    columns = {col['name'] for col in inspector.get_columns('message')}
     
     # Drop context_id column if it exists
     if 'context_id' in columns:
@@ -21,8 +21,7 @@ depends_on: str | Sequence[str] | None = None
 def upgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    table_names = inspector.get_table_names()  # noqa
-    column_names = [column["name"] for column in inspector.get_columns("message")]
+    column_names = {column["name"] for column in inspector.get_columns("message")}
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table("message", schema=None) as batch_op:
         if "properties" not in column_names:
@@ -38,8 +37,7 @@ def upgrade() -> None:
 def downgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    table_names = inspector.get_table_names()  # noqa
-    column_names = [column["name"] for column in inspector.get_columns("message")]
+    column_names = {column["name"] for column in inspector.get_columns("message")}
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table("message", schema=None) as batch_op:
         if "content_blocks" in column_names:
@@ -22,7 +22,7 @@ def upgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
     # ### commands auto generated by Alembic - please adjust! ###
-    column_names = [column["name"] for column in inspector.get_columns("variable")]
+    column_names = {column["name"] for column in inspector.get_columns("variable")}
     with op.batch_alter_table("variable", schema=None) as batch_op:
         if "default_fields" not in column_names:
             batch_op.add_column(sa.Column("default_fields", sa.JSON(), nullable=True))
@@ -34,7 +34,7 @@ def downgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
     # ### commands auto generated by Alembic - please adjust! ###
-    column_names = [column["name"] for column in inspector.get_columns("variable")]
+    column_names = {column["name"] for column in inspector.get_columns("variable")}
     with op.batch_alter_table("variable", schema=None) as batch_op:
         if "default_fields" in column_names:
             batch_op.drop_column("default_fields")
@@ -99,7 +99,7 @@ def upgrade() -> None:
     if "_alembic_tmp_flow" in existing_tables:
         op.drop_table("_alembic_tmp_flow")
     with op.batch_alter_table("flow", schema=None) as batch_op:
-        flow_columns = [col["name"] for col in inspector.get_columns("flow")]
+        flow_columns = {col["name"] for col in inspector.get_columns("flow")}
         if "user_id" not in flow_columns:
             batch_op.add_column(
                 sa.Column(
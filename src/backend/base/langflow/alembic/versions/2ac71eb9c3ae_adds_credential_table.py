@@ -23,9 +23,8 @@ def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    tables = inspector.get_table_names()
     try:
-        if "credential" not in tables:
+        if not inspector.has_table("credential"):
             op.create_table(
                 "credential",
                 sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
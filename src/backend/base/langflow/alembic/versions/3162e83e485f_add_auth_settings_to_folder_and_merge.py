@@ -24,13 +24,12 @@ def upgrade() -> None:
     inspector = sa.inspect(conn)
 
     # Check if folder table exists
-    table_names = inspector.get_table_names()
-    if "folder" not in table_names:
+    if not inspector.has_table("folder"):
         # If folder table doesn't exist, skip this migration
         return
 
     # Get current column names in folder table
-    column_names = [column["name"] for column in inspector.get_columns("folder")]
+    column_names = {column["name"] for column in inspector.get_columns("folder")}
 
     # Add auth_settings column to folder table if it doesn't exist
     with op.batch_alter_table("folder", schema=None) as batch_op:
@@ -44,13 +43,12 @@ def downgrade() -> None:
     inspector = sa.inspect(conn)
 
     # Check if folder table exists
-    table_names = inspector.get_table_names()
-    if "folder" not in table_names:
+    if not inspector.has_table("folder"):
         # If folder table doesn't exist, skip this migration
         return
 
     # Get current column names in folder table
-    column_names = [column["name"] for column in inspector.get_columns("folder")]
+    column_names = {column["name"] for column in inspector.get_columns("folder")}
 
     # Remove auth_settings column from folder table if it exists
     with op.batch_alter_table("folder", schema=None) as batch_op:
@@ -21,11 +21,10 @@ depends_on: str | Sequence[str] | None = None
 def upgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    table_names = inspector.get_table_names()
     # ### commands auto generated by Alembic - please adjust! ###
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    column_names = {column["name"] for column in inspector.get_columns("flow")}
     with op.batch_alter_table("flow", schema=None) as batch_op:
-        if "flow" in table_names and "webhook" not in column_names:
+        if inspector.has_table("flow") and "webhook" not in column_names:
             batch_op.add_column(sa.Column("webhook", sa.Boolean(), nullable=True))
 
     # ### end Alembic commands ###
@@ -34,11 +33,10 @@ def upgrade() -> None:
 def downgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    table_names = inspector.get_table_names()
     # ### commands auto generated by Alembic - please adjust! ###
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    column_names = {column["name"] for column in inspector.get_columns("flow")}
     with op.batch_alter_table("flow", schema=None) as batch_op:
-        if "flow" in table_names and "webhook" in column_names:
+        if inspector.has_table("flow") and "webhook" in column_names:
             batch_op.drop_column("webhook")
 
     # ### end Alembic commands ###
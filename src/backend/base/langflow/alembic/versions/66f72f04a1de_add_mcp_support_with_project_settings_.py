@@ -22,7 +22,7 @@ depends_on: str | Sequence[str] | None = None
 def upgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    column_names = {column["name"] for column in inspector.get_columns("flow")}
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table("flow", schema=None) as batch_op:
         if "mcp_enabled" not in column_names:
@@ -38,7 +38,7 @@ def upgrade() -> None:
 def downgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    column_names = {column["name"] for column in inspector.get_columns("flow")}
 
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table("flow", schema=None) as batch_op:
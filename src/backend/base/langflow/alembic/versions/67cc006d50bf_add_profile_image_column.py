@@ -24,7 +24,7 @@ def upgrade() -> None:
     try:
         conn = op.get_bind()
         inspector = sa.inspect(conn)  # type: ignore
-        if "user" in inspector.get_table_names() and "profile_image" not in [
+        if inspector.has_table("user") and "profile_image" not in [
             column["name"] for column in inspector.get_columns("user")
         ]:
             with op.batch_alter_table("user", schema=None) as batch_op:
@@ -45,7 +45,7 @@ def downgrade() -> None:
     try:
         conn = op.get_bind()
         inspector = sa.inspect(conn)  # type: ignore
-        if "user" in inspector.get_table_names() and "profile_image" in [
+        if inspector.has_table("user") and "profile_image" in [
             column["name"] for column in inspector.get_columns("user")
         ]:
             with op.batch_alter_table("user", schema=None) as batch_op:
@@ -23,8 +23,8 @@ def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    flow_columns = [column["name"] for column in inspector.get_columns("flow")]
-    user_columns = [column["name"] for column in inspector.get_columns("user")]
+    flow_columns = {column["name"] for column in inspector.get_columns("flow")}
+    user_columns = {column["name"] for column in inspector.get_columns("user")}
     try:
         if "is_component" not in flow_columns:
             with op.batch_alter_table("flow", schema=None) as batch_op:
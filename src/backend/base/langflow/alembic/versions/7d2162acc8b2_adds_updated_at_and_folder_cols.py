@@ -23,8 +23,8 @@ def upgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    api_key_columns = [column["name"] for column in inspector.get_columns("apikey")]
-    flow_columns = [column["name"] for column in inspector.get_columns("flow")]
+    api_key_columns = {column["name"] for column in inspector.get_columns("apikey")}
+    flow_columns = {column["name"] for column in inspector.get_columns("flow")}
 
     try:
         if "name" in api_key_columns:
@@ -50,7 +50,7 @@ def downgrade() -> None:
     try:
         conn = op.get_bind()
         inspector = sa.inspect(conn)  # type: ignore
-        column_names = [column["name"] for column in inspector.get_columns("flow")]
+        column_names = {column["name"] for column in inspector.get_columns("flow")}
         with op.batch_alter_table("flow", schema=None) as batch_op:
             if "folder" in column_names:
                 batch_op.drop_column("folder")
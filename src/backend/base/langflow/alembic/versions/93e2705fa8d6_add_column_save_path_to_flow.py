@@ -11,6 +11,7 @@ from collections.abc import Sequence
 import sqlalchemy as sa
 import sqlmodel
 from alembic import op
+from langflow.utils import migration
 
 # revision identifiers, used by Alembic.
 revision: str = "93e2705fa8d6"
@@ -21,21 +22,13 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     conn = op.get_bind()
-    inspector = sa.inspect(conn)  # type: ignore
     # ### commands auto generated by Alembic - please adjust! ###
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
-    with op.batch_alter_table("flow", schema=None) as batch_op:
-        if "fs_path" not in column_names:
-            batch_op.add_column(sa.Column("fs_path", sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+    migration.ensure_columns("flow", [sa.Column("fs_path", sqlmodel.sql.sqltypes.AutoString(), nullable=True)], conn)
 
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     conn = op.get_bind()
-    inspector = sa.inspect(conn)  # type: ignore
     # ### commands auto generated by Alembic - please adjust! ###
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
-    with op.batch_alter_table("flow", schema=None) as batch_op:
-        if "fs_path" in column_names:
-            batch_op.drop_column("fs_path")
+    migration.drop_columns_if_exist("flow", ["fs_path"], conn)
@@ -23,7 +23,7 @@ def upgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
     # ### commands auto generated by Alembic - please adjust! ###
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    column_names = {column["name"] for column in inspector.get_columns("flow")}
     indexes = inspector.get_indexes("flow")
     index_names = [index["name"] for index in indexes]
     with op.batch_alter_table("flow", schema=None) as batch_op:
@@ -39,7 +39,7 @@ def downgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
     # ### commands auto generated by Alembic - please adjust! ###
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    column_names = {column["name"] for column in inspector.get_columns("flow")}
     indexes = inspector.get_indexes("flow")
     index_names = [index["name"] for index in indexes]
     with op.batch_alter_table("flow", schema=None) as batch_op:
@@ -30,7 +30,7 @@ def upgrade() -> None:
         if "flowstyle" in tables:
             op.drop_table("flowstyle")
         with op.batch_alter_table("flow", schema=None) as batch_op:
-            flow_columns = [column["name"] for column in inspector.get_columns("flow")]
+            flow_columns = {column["name"] for column in inspector.get_columns("flow")}
             if "is_component" not in flow_columns:
                 batch_op.add_column(sa.Column("is_component", sa.Boolean(), nullable=True))
             if "updated_at" not in flow_columns:
@@ -61,7 +61,7 @@ def downgrade() -> None:
     inspector = sa.inspect(conn)
     try:
         # Re-create the dropped table 'flowstyle' if it was previously dropped in upgrade
-        if "flowstyle" not in inspector.get_table_names():
+        if not inspector.has_table("flowstyle"):
             op.create_table(
                 "flowstyle",
                 sa.Column("color", sa.String(), nullable=False),
@@ -75,7 +75,7 @@ def downgrade() -> None:
 
         with op.batch_alter_table("flow", schema=None) as batch_op:
             # Check and remove newly added columns and constraints in upgrade
-            flow_columns = [column["name"] for column in inspector.get_columns("flow")]
+            flow_columns = {column["name"] for column in inspector.get_columns("flow")}
             if "user_id" in flow_columns:
                 batch_op.drop_column("user_id")
             if "folder" in flow_columns:
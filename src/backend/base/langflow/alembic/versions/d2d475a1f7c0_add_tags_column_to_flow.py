@@ -23,9 +23,7 @@ depends_on: str | Sequence[str] | None = None
 def upgrade() -> None:
     conn = op.get_bind()
     # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table("flow", schema=None) as batch_op:
-        if not migration.column_exists(table_name="flow", column_name="tags", conn=conn):
-            batch_op.add_column(sa.Column("tags", sa.JSON(), nullable=True))
+    migration.ensure_columns("flow", [sa.Column("tags", sa.JSON(), nullable=True)], conn)
 
     # ### end Alembic commands ###
 
@@ -33,8 +31,6 @@ def upgrade() -> None:
 def downgrade() -> None:
     conn = op.get_bind()
     # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table("flow", schema=None) as batch_op:
-        if migration.column_exists(table_name="flow", column_name="tags", conn=conn):
-            batch_op.drop_column("tags")
+    migration.drop_columns_if_exist("flow", ["tags"], conn)
 
     # ### end Alembic commands ###
@@ -27,8 +27,7 @@ def upgrade() -> None:
     inspector = sa.inspect(conn)
     
     # Check if file table exists
-    table_names = inspector.get_table_names()
-    if "file" not in table_names:
+    if not inspector.has_table("file"):
         logger.info("file table does not exist, skipping")
         return
     
@@ -148,8 +147,7 @@ def downgrade() -> None:
     inspector = sa.inspect(conn)
     
     # Check if file table exists
-    table_names = inspector.get_table_names()
-    if "file" not in table_names:
+    if not inspector.has_table("file"):
         logger.info("file table does not exist, skipping downgrade")
         return
     
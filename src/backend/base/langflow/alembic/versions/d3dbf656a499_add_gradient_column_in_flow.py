@@ -24,9 +24,7 @@ depends_on: str | Sequence[str] | None = None
 def upgrade() -> None:
     conn = op.get_bind()
     # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table("flow", schema=None) as batch_op:
-        if not migration.column_exists(table_name="flow", column_name="gradient", conn=conn):
-            batch_op.add_column(sa.Column("gradient", sqlmodel.sql.sqltypes.AutoString(), nullable=True))
+    migration.ensure_columns("flow", [sa.Column("gradient", sqlmodel.sql.sqltypes.AutoString(), nullable=True)], conn)
 
     # ### end Alembic commands ###
 
@@ -34,8 +32,6 @@ def upgrade() -> None:
 def downgrade() -> None:
     conn = op.get_bind()
     # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table("flow", schema=None) as batch_op:
-        if migration.column_exists(table_name="flow", column_name="gradient", conn=conn):
-            batch_op.drop_column("gradient")
+    migration.drop_columns_if_exist("flow", ["gradient"], conn)
 
     # ### end Alembic commands ###
@@ -23,9 +23,7 @@ def upgrade() -> None:
 
     # Check if the folder table exists
     inspector = sa.inspect(conn)
-    table_names = inspector.get_table_names()
-
-    if "folder" not in table_names:
+    if not inspector.has_table("folder"):
         # If folder table doesn't exist, skip this migration
         return
 
@@ -50,9 +48,7 @@ def downgrade() -> None:
 
     # Check if the folder table exists
     inspector = sa.inspect(conn)
-    table_names = inspector.get_table_names()
-
-    if "folder" not in table_names:
+    if not inspector.has_table("folder"):
         # If folder table doesn't exist, skip this migration
         return
 
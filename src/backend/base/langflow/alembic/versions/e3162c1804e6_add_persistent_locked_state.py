@@ -10,7 +10,6 @@ from collections.abc import Sequence
 
 import sqlalchemy as sa
 from alembic import op
-from sqlalchemy.engine.reflection import Inspector
 
 # revision identifiers, used by Alembic.
 revision: str = "e3162c1804e6"
@@ -21,9 +20,8 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     conn = op.get_bind()
-    inspector = Inspector.from_engine(conn)  # type: ignore
-    table_names = inspector.get_table_names()  # noqa
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = {column["name"] for column in inspector.get_columns("flow")}
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table("flow", schema=None) as batch_op:
         if "locked" not in column_names:
@@ -33,9 +31,8 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     conn = op.get_bind()
-    inspector = Inspector.from_engine(conn)  # type: ignore
-    table_names = inspector.get_table_names()  # noqa
-    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = {column["name"] for column in inspector.get_columns("flow")}
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table("flow", schema=None) as batch_op:
         if "locked" in column_names:
@@ -21,9 +21,8 @@ depends_on: str | Sequence[str] | None = None
 def upgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    table_names = inspector.get_table_names()
     # ### commands auto generated by Alembic - please adjust! ###
-    if "variable" not in table_names:
+    if not inspector.has_table("variable"):
         return
     columns = [column for column in inspector.get_columns("variable")]
     column_names = [column["name"] for column in columns]
@@ -47,9 +46,8 @@ def upgrade() -> None:
 def downgrade() -> None:
     conn = op.get_bind()
     inspector = sa.inspect(conn)  # type: ignore
-    table_names = inspector.get_table_names()
     # ### commands auto generated by Alembic - please adjust! ###
-    if "variable" not in table_names:
+    if not inspector.has_table("variable"):
         return
     columns = [column for column in inspector.get_columns("variable")]
     column_names = [column["name"] for column in columns]
@@ -11,6 +11,8 @@ from collections.abc import Sequence
 import sqlalchemy as sa
 from alembic import op
 
+from langflow.utils import migration
+
 # revision identifiers, used by Alembic.
 revision: str = "eb5e72293a8e"
 down_revision: str | None = "5ace73a7f223"
@@ -20,29 +22,22 @@ depends_on: str | Sequence[str] | None = None
 
 def upgrade() -> None:
     conn = op.get_bind()
-    inspector = sa.inspect(conn)  # type: ignore
-    table_names = inspector.get_table_names()  # noqa
-    column_names = [column["name"] for column in inspector.get_columns("message")]
     # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table("message", schema=None) as batch_op:
-        if "error" not in column_names:
-            batch_op.add_column(sa.Column("error", sa.Boolean(), nullable=False, server_default=sa.false()))
-        if "edit" not in column_names:
-            batch_op.add_column(sa.Column("edit", sa.Boolean(), nullable=False, server_default=sa.false()))
+    migration.ensure_columns(
+        "message",
+        [
+            sa.Column("error", sa.Boolean(), nullable=False, server_default=sa.false()),
+            sa.Column("edit", sa.Boolean(), nullable=False, server_default=sa.false()),
+        ],
+        conn,
+    )
 
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     conn = op.get_bind()
-    inspector = sa.inspect(conn)  # type: ignore
-    table_names = inspector.get_table_names()  # noqa
-    column_names = [column["name"] for column in inspector.get_columns("message")]
     # ### commands auto generated by Alembic - please adjust! ###
-    with op.batch_alter_table("message", schema=None) as batch_op:
-        if "edit" in column_names:
-            batch_op.drop_column("edit")
-        if "error" in column_names:
-            batch_op.drop_column("error")
+    migration.drop_columns_if_exist("message", ["edit", "error"], conn)
 
     # ### end Alembic commands ###
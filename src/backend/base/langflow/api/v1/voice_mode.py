@@ -1,22 +1,23 @@
 import asyncio
-import base64
-import json
 import os
+import re
 import time
 import traceback
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime, timezone
 from functools import lru_cache, partial
 from typing import Any
 from uuid import UUID, uuid4
 
 import numpy as np
+import orjson
 import requests
 import sqlalchemy
 import websockets
+from cachetools import TTLCache
 from cryptography.fernet import InvalidToken
-from elevenlabs import ElevenLabs
+from elevenlabs import AsyncElevenLabs
 from fastapi import APIRouter, BackgroundTasks
 from lfx.log import logger
 from lfx.schema.schema import InputValueRequest
@@ -32,8 +33,21 @@ from langflow.services.auth.utils import get_current_user_for_websocket
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.database.models.user.model import User
-from langflow.services.deps import get_variable_service, session_scope
-from langflow.utils.voice_utils import BYTES_PER_24K_FRAME, VAD_SAMPLE_RATE_16K, resample_24k_to_16k
+from langflow.services.deps import get_variable_service
+from langflow.settings import DEV
+from langflow.utils.voice_utils import (
+    BYTES_PER_16K_FRAME,
+    BYTES_PER_24K_FRAME,
+    VAD_SAMPLE_RATE_16K,
+    resample_24k_to_16k_frames,
+    split_sentences,
+)
+
+try:
+    # SIMD base64 with the stdlib API; installed alongside chromadb but not required
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 router = APIRouter(prefix="/voice", tags=["Voice"])
 
@@ -75,9 +89,30 @@ LF_TO_OPENAI = "LF → OpenAI"
 LF_TO_CLIENT = "LF → Client"
 OPENAI_TO_LF = "OpenAI → LF"
 CLIENT_TO_LF = "Client → LF"
+
+# Per-frame diagnostics are only emitted in dev mode; checked once at import to keep the audio paths cheap
+_TRACE_ENABLED = DEV
+
+# OpenAI puts "type" first in every server event, so it can be read without parsing the frame
+_LEADING_EVENT_TYPE = re.compile(r'\{\s*"type"\s*:\s*"([^"\\]+)"')
+# High-volume events that are relayed to the client untouched
+PASSTHROUGH_EVENT_TYPES = frozenset({"response.audio.delta", "response.audio_transcript.delta"})
+_AUDIO_DELTA_PREFIX = '{"type":"response.audio.delta","delta":"'
+# Audio deltas a stalled client may have waiting before the oldest ones are dropped (~128 chunks of speech)
+CLIENT_AUDIO_BACKLOG = 128
 # --- Helper Functions ---
 
 
+def get_end_vertex_text(event_data: dict) -> str:
+    """Return the message text of an end_vertex build event, or "" when the vertex produced none."""
+    node: Any = event_data
+    for key in ("data", "build_data", "data", "results", "message", "text"):
+        if not isinstance(node, dict):
+            return ""
+        node = node.get(key)
+    return node if isinstance(node, str) else ""
+
+
 @lru_cache(maxsize=1)
 def get_vad():
     import webrtcvad
@@ -164,36 +199,43 @@ class VoiceConfig:
 
 
 class ElevenLabsClientManager:
-    _instance = None
-    _api_key = None
+    # One client per API key, shared by every connection so its HTTP connection pool stays warm
+    _clients: dict[str, AsyncElevenLabs] = {}
 
     @classmethod
     async def get_client(cls, user_id=None, session=None):
-        """Get or create an ElevenLabs client with the API key."""
-        if cls._instance is None:
-            if cls._api_key is None and user_id and session:
-                variable_service = get_variable_service()
-                try:
-                    cls._api_key = await variable_service.get_variable(
-                        user_id=user_id,
-                        name="ELEVENLABS_API_KEY",
-                        field="elevenlabs_api_key",
-                        session=session,
-                    )
-                except (InvalidToken, ValueError) as e:
-                    await logger.aerror(f"Error with ElevenLabs API key: {e}")
-                    cls._api_key = os.getenv("ELEVENLABS_API_KEY", "")
-                    if not cls._api_key:
-                        await logger.aerror("ElevenLabs API key not found")
-                        return None
-                except (KeyError, AttributeError, sqlalchemy.exc.SQLAlchemyError) as e:
-                    await logger.aerror(f"Exception getting ElevenLabs API key: {e}")
-                    return None
-
-            if cls._api_key:
-                cls._instance = ElevenLabs(api_key=cls._api_key)
-
-        return cls._instance
+        """Get or create the shared ElevenLabs client for the user's API key."""
+        api_key = None
+        if user_id and session:
+            variable_service = get_variable_service()
+            try:
+                api_key = await variable_service.get_variable(
+                    user_id=user_id,
+                    name="ELEVENLABS_API_KEY",
+                    field="elevenlabs_api_key",
+                    session=session,
+                )
+            except (InvalidToken, ValueError) as e:
+                await logger.aerror(f"Error with ElevenLabs API key: {e}")
+            except (KeyError, AttributeError, sqlalchemy.exc.SQLAlchemyError) as e:
+                await logger.aerror(f"Exception getting ElevenLabs API key: {e}")
+                return None
+        if not api_key:
+            api_key = os.getenv("ELEVENLABS_API_KEY", "")
+            if not api_key:
+                await logger.aerror("ElevenLabs API key not found")
+                return None
+
+        client = cls._clients.get(api_key)
+        if client is None:
+            client = cls._clients[api_key] = AsyncElevenLabs(api_key=api_key)
+        return client
+
+
+@lru_cache(maxsize=32)
+def get_openai_client(openai_key: str) -> OpenAI:
+    """Return a shared OpenAI client per API key so TTS requests reuse its connection pool."""
+    return OpenAI(api_key=openai_key)
 
 
 def get_voice_config(session_id: str) -> VoiceConfig:
@@ -231,7 +273,7 @@ class TTSConfig:
             },
         }
         self.tts_session: dict[str, Any] = {}
-        self.oai_client = OpenAI(api_key=openai_key)
+        self.oai_client = get_openai_client(openai_key)
         self.openai_voice = "echo"
 
     def get_session_dict(self):
@@ -327,6 +369,46 @@ async def process_message_queue(queue_key, session):
         await logger.aerror(traceback.format_exc())
 
 
+def is_serialized_audio_delta(item: dict | str | None) -> bool:
+    if not isinstance(item, str):
+        return False
+    match = _LEADING_EVENT_TYPE.match(item)
+    return match is not None and match.group(1) == "response.audio.delta"
+
+
+class ClientSendQueue(asyncio.Queue):
+    """Outbound client queue that keeps at most `max_audio` serialized audio deltas waiting.
+
+    When a slow client lets the backlog fill up, the oldest queued audio delta is dropped to admit
+    the new one, so playback resumes on fresh audio. Control events are never dropped.
+    """
+
+    def __init__(self, max_audio: int = CLIENT_AUDIO_BACKLOG):
+        self._max_audio = max_audio
+        super().__init__()
+
+    def _init(self, _maxsize):
+        self._queue: deque = deque()
+        self._audio_pending = 0
+
+    def _put(self, item):
+        if is_serialized_audio_delta(item):
+            if self._audio_pending >= self._max_audio:
+                for index, queued in enumerate(self._queue):
+                    if is_serialized_audio_delta(queued):
+                        del self._queue[index]
+                        break
+            else:
+                self._audio_pending += 1
+        self._queue.append(item)
+
+    def _get(self):
+        item = self._queue.popleft()
+        if is_serialized_audio_delta(item):
+            self._audio_pending -= 1
+        return item
+
+
 class SendQueues:
     def __init__(self, openai_ws: websockets.WebSocketClientProtocol, client_ws: WebSocket, log_event):
         self.openai_ws: websockets.WebSocketClientProtocol = openai_ws
@@ -337,7 +419,7 @@ class SendQueues:
         self.block.set()
 
         self.client_ws: WebSocket = client_ws
-        self.client_send_q: asyncio.Queue[dict] = asyncio.Queue()
+        self.client_send_q: ClientSendQueue = ClientSendQueue()
         self.client_writer_task: asyncio.Task = asyncio.create_task(self.__client_writer())
         self.log_event = log_event
 
@@ -348,7 +430,8 @@ class SendQueues:
             logger.error(traceback.format_exc())
 
     def openai_unblock(self):
-        logger.trace("OPENAI UNBLOCKING")
+        if _TRACE_ENABLED:
+            logger.debug("OPENAI UNBLOCKING")
         self.block.set()
 
     async def __openai_writer(self):
@@ -358,11 +441,12 @@ class SendQueues:
                 if msg is None:
                     break
                 await self.block.wait()
-                await self.openai_ws.send(json.dumps(msg))
+                await self.openai_ws.send(orjson.dumps(msg).decode())
                 self.log_event(msg, LF_TO_OPENAI)
                 if is_blocking:
                     self.block.clear()
-                    logger.trace("OPENAI BLOCKING")
+                    if _TRACE_ENABLED:
+                        logger.debug("OPENAI BLOCKING")
                 # log_event(msg, DIRECTION_TO_OPENAI)
         except Exception:  # noqa: BLE001
             await logger.aerror(traceback.format_exc())
@@ -374,14 +458,21 @@ class SendQueues:
         except Exception:  # noqa: BLE001
             logger.error(traceback.format_exc())
 
+    def client_send_raw(self, text: str):
+        """Queue an already serialized event for the client."""
+        self.client_send_q.put_nowait(text)
+
     async def __client_writer(self):
         try:
             while True:
                 msg = await self.client_send_q.get()
                 if msg is None:
                     break
+                if isinstance(msg, str):
+                    await self.client_ws.send_text(msg)
+                    continue
                 self.log_event(msg, LF_TO_CLIENT)
-                await self.client_ws.send_text(json.dumps(msg))
+                await self.client_ws.send_text(orjson.dumps(msg).decode())
         except Exception:  # noqa: BLE001
             await logger.aerror(traceback.format_exc())
 
@@ -420,7 +511,7 @@ async def handle_function_call(
     create_response = get_create_response(msg_handler, session_id)
     """Handle function calls from the OpenAI API."""
     try:
-        args = json.loads(function_call_args) if function_call_args else {}
+        args = orjson.loads(function_call_args) if function_call_args else {}
         input_request = InputValueRequest(
             input_value=args.get("input"), components=[], type="chat", session=conversation_id
         )
@@ -430,22 +521,15 @@ async def handle_function_call(
             background_tasks=background_tasks,
             current_user=current_user,
         )
-        result = ""
+        text_parts: list[str] = []
         async for line in response.body_iterator:
             if not line:
                 continue
-            event_data = json.loads(line)
+            event_data = orjson.loads(line)
             msg_handler.client_send({"type": "flow.build.progress", "data": event_data})
             if event_data.get("event") == "end_vertex":
-                text_part = (
-                    event_data.get("data", {})
-                    .get("build_data", "")
-                    .get("data", {})
-                    .get("results", {})
-                    .get("message", {})
-                    .get("text", "")
-                )
-                result += text_part
+                text_parts.append(get_end_vertex_text(event_data))
+        result = "".join(text_parts)
         function_output = {
             "type": "conversation.item.create",
             "item": {
@@ -456,7 +540,7 @@ async def handle_function_call(
         }
         msg_handler.openai_send(function_output)
         create_response()
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         trace = traceback.format_exc()
         await logger.aerror(f"JSON decode error: {e!s}\ntrace: {trace}")
         function_output = {
@@ -517,15 +601,27 @@ message_tasks: dict[str, asyncio.Task] = {}
 last_sender_by_session: defaultdict[str, str | None] = defaultdict(lambda: None)
 
 
-async def get_flow_desc_from_db(flow_id: str) -> Flow:
-    async with session_scope() as session:
-        stmt = select(Flow).where(Flow.id == UUID(flow_id))
-        result = await session.exec(stmt)
-        flow = result.scalar_one_or_none()
-        if not flow:
-            msg = f"Flow with id {flow_id} not found"
-            raise ValueError(msg)
-        return flow.description
+FLOW_DESC_TTL_SECONDS = 60
+FLOW_DESC_CACHE_SIZE = 1024
+_flow_desc_cache: TTLCache = TTLCache(maxsize=FLOW_DESC_CACHE_SIZE, ttl=FLOW_DESC_TTL_SECONDS)
+_MISSING = object()
+
+
+async def get_flow_desc_from_db(flow_id: str, session: DbSession) -> str | None:
+    """Return the flow description, cached per flow for FLOW_DESC_TTL_SECONDS to spare reconnects a query."""
+    # A flow may have no description, so None is a cacheable value and misses use a sentinel
+    description = _flow_desc_cache.get(flow_id, _MISSING)
+    if description is not _MISSING:
+        return description
+    stmt = select(Flow.description).where(Flow.id == UUID(flow_id))
+    result = await session.exec(stmt)
+    row = result.one_or_none()
+    if row is None:
+        msg = f"Flow with id {flow_id} not found"
+        raise ValueError(msg)
+    description = row[0]
+    _flow_desc_cache[flow_id] = description
+    return description
 
 
 async def get_or_create_elevenlabs_client(user_id=None, session=None):
@@ -533,13 +629,31 @@ async def get_or_create_elevenlabs_client(user_id=None, session=None):
     return await ElevenLabsClientManager.get_client(user_id, session)
 
 
-def pcm16_to_float_array(pcm_data):
-    values = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32)
-    return values / 32768.0
+def audio_delta_payload(audio_chunk: bytes, response_id: str | None = None) -> str:
+    """Serialize a response.audio.delta event for the client.
+
+    Base64 needs no JSON escaping, so the event is assembled around the encoded audio directly
+    instead of building a dict and running it through the serializer for every chunk.
+    """
+    payload = _AUDIO_DELTA_PREFIX + base64.b64encode(audio_chunk).decode("ascii") + '"'
+    if response_id is not None:
+        payload += ',"response_id":' + orjson.dumps(response_id).decode()
+    return payload + "}"
+
+
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def pcm16_to_float_array(pcm_data, out=None):
+    # Cast and scale in one ufunc pass; pass `out` to reuse a float32 buffer across frames
+    return np.multiply(np.frombuffer(pcm_data, dtype=np.int16), _PCM16_SCALE, out=out, dtype=np.float32)
+
+
+_TEXT_SPLITTERS = frozenset(".,?!;:—-()[]} ")
 
 
 async def text_chunker_with_timeout(chunks, timeout=0.3):
-    splitters = (".", ",", "?", "!", ";", ":", "—", "-", "(", ")", "[", "]", "}", " ")
+    splitters = _TEXT_SPLITTERS
     buffer = ""
     ait = chunks.__aiter__()
     while True:
@@ -581,8 +695,8 @@ def create_event_logger():
 
     def log_event(event: dict, provenance: str) -> None:
         event_type = event.get("type", "None")
-        response_id = event.get("response_id") or event.get("response", {}).get("id", None)
         if event_type != state["last_event_type"]:
+            response_id = event.get("response_id") or event.get("response", {}).get("id", None)
             logger.debug(f"Event (response_id - {response_id}): {provenance} {event_type}")
             state["last_event_type"] = event_type
             state["event_count"] = 0
@@ -733,7 +847,7 @@ async def flow_as_tool_websocket(
         if current_user is None or openai_key is None:
             return
         try:
-            flow_description = await get_flow_desc_from_db(flow_id)
+            flow_description = await get_flow_desc_from_db(flow_id, session)
             flow_tool = {
                 "name": "execute_flow",
                 "type": "function",
@@ -761,7 +875,7 @@ async def flow_as_tool_websocket(
             session_dict["tools"] = [flow_tool]
             return session_dict
 
-        async with websockets.connect(url, extra_headers=headers) as openai_ws:
+        async with websockets.connect(url, extra_headers=headers, compression=None) as openai_ws:
             msg_handler = SendQueues(openai_ws, client_websocket, log_event)
 
             openai_realtime_session = init_session_dict()
@@ -780,34 +894,41 @@ async def flow_as_tool_websocket(
                 vad = get_vad()
                 while True:
                     base64_data = await vad_queue.get()
-                    raw_chunk_24k = base64.b64decode(base64_data)
-                    vad_audio_buffer.extend(raw_chunk_24k)
+                    vad_audio_buffer.extend(base64.b64decode(base64_data))
+                    # Take whatever else arrived meanwhile so a backlog is resampled and classified in one pass
+                    while not vad_queue.empty():
+                        vad_audio_buffer.extend(base64.b64decode(vad_queue.get_nowait()))
                     has_speech = False
-                    while len(vad_audio_buffer) >= BYTES_PER_24K_FRAME:
-                        frame_24k = vad_audio_buffer[:BYTES_PER_24K_FRAME]
-                        del vad_audio_buffer[:BYTES_PER_24K_FRAME]
+                    whole_frames = len(vad_audio_buffer) - len(vad_audio_buffer) % BYTES_PER_24K_FRAME
+                    if whole_frames:
                         try:
-                            frame_16k = resample_24k_to_16k(frame_24k)
-                            is_speech = vad.is_speech(frame_16k, VAD_SAMPLE_RATE_16K)
-                            if is_speech:
-                                has_speech = True
-                                logger.trace("!", end="")
-                                if bot_speaking_flag[0]:
-                                    msg_handler.openai_send({"type": "response.cancel"})
-                                    bot_speaking_flag[0] = False
+                            # Resample every complete frame of the chunk in one call, then classify 20ms at a time.
+                            # The view hands the frames to numpy without copying them out of the buffer.
+                            with memoryview(vad_audio_buffer) as buffer_view:
+                                frames_16k = memoryview(resample_24k_to_16k_frames(buffer_view[:whole_frames]))
+                            # webrtcvad reads any buffer, so each frame is a zero-copy slice of the resampled run
+                            for offset in range(0, len(frames_16k), BYTES_PER_16K_FRAME):
+                                frame_16k = frames_16k[offset : offset + BYTES_PER_16K_FRAME]
+                                if vad.is_speech(frame_16k, VAD_SAMPLE_RATE_16K):
+                                    has_speech = True
+                                    if _TRACE_ENABLED:
+                                        logger.debug("!")
+                                    if bot_speaking_flag[0]:
+                                        msg_handler.openai_send({"type": "response.cancel"})
+                                        bot_speaking_flag[0] = False
+                                    # One speech frame decides the chunk, so its remaining frames skip the VAD
+                                    break
                         except Exception as e:  # noqa: BLE001
                             await logger.aerror(f"[ERROR] VAD processing failed (ValueError): {e}")
-                            continue
+                        del vad_audio_buffer[:whole_frames]
                     if has_speech:
                         last_speech_time = datetime.now(tz=timezone.utc)
-                        logger.trace(".", end="")
-                    else:
+                        if _TRACE_ENABLED:
+                            logger.debug(".")
+                    elif _TRACE_ENABLED:
                         time_since_speech = (datetime.now(tz=timezone.utc) - last_speech_time).total_seconds()
                         if time_since_speech >= 1.0:
-                            logger.trace("_", end="")
-
-            def client_send_event_from_thread(event, loop) -> None:
-                return loop.call_soon_threadsafe(msg_handler.client_send, event)
+                            logger.debug("_")
 
             def pass_through(from_dict, to_dict, keys):
                 for key in keys:
@@ -863,17 +984,13 @@ async def flow_as_tool_websocket(
             responses = {}
 
             async def process_text_deltas(rsp: Response):
-                """Transfer text deltas from the async queue to a synchronous queue.
-
-                then run the ElevenLabs TTS call (which expects a sync generator) in a separate thread.
-                """
+                """Stream ElevenLabs audio for each sentence of the response text as it arrives."""
                 try:
                     elevenlabs_client = await get_or_create_elevenlabs_client(current_user.id, session)
                     if elevenlabs_client is None:
                         return
 
                     async def get_chunks(q: asyncio.Queue):
-                        delims = [".", "?", ";", "!"]
                         buf: str = ""
                         while True:
                             text = await q.get()
@@ -881,44 +998,25 @@ async def flow_as_tool_websocket(
                                 if len(buf) > 0:
                                     yield buf
                                 return
-                            buf += text
-                            delim_locs = []
-                            for delim in delims:
-                                i = buf.find(delim)
-                                while i != -1:
-                                    delim_locs.append(i)
-                                    i = buf.find(delim, i + 1)
-                            substr_begin = 0
-                            for delim_loc in delim_locs:
-                                chunk = buf[substr_begin : delim_loc + 1]
-                                substr_begin = delim_loc + 1
-                                yield chunk
-                            buf = buf[substr_begin:]
+                            sentences, buf = split_sentences(buf + text)
+                            for sentence in sentences:
+                                yield sentence
 
                     chunk_gen = get_chunks(rsp.text_delta_queue)
 
                     async for text_chunk in chunk_gen:
-                        audio_chunks = elevenlabs_client.generate(
+                        audio_chunks = await elevenlabs_client.generate(
                             voice=voice_config.elevenlabs_voice,
                             output_format="pcm_24000",
-                            text=text_chunk,  # synchronous generator expected by ElevenLabs
+                            text=text_chunk,
                             model=voice_config.elevenlabs_model,
                             voice_settings=None,
                             stream=True,
                         )
-                        for audio_chunk in audio_chunks:
-                            base64_audio = base64.b64encode(audio_chunk).decode("utf-8")
-                            # Schedule sending the audio chunk in the main event loop.
-                            event = {
-                                "type": "response.audio.delta",
-                                "delta": base64_audio,
-                                "response_id": rsp.response_id,
-                            }
-                            # client_send_event_from_thread(event, main_loop)
-                            msg_handler.client_send(event)
+                        async for audio_chunk in audio_chunks:
+                            msg_handler.client_send_raw(audio_delta_payload(audio_chunk, rsp.response_id))
 
                     event = {"type": "response.audio.done", "response_id": rsp.response_id}
-                    # client_send_event_from_thread(event, main_loop)
                     msg_handler.client_send(event)
                 except Exception:  # noqa: BLE001
                     await logger.aerror(traceback.format_exc())
@@ -930,10 +1028,11 @@ async def flow_as_tool_websocket(
                     num_audio_samples = 0  # Initialize as an integer instead of None
                     while True:
                         message_text = await client_websocket.receive_text()
-                        msg = json.loads(message_text)
+                        msg = orjson.loads(message_text)
                         log_event(msg, CLIENT_TO_LF)
                         if msg.get("type") == "input_audio_buffer.append":
-                            logger.trace(f"buffer_id {msg.get('buffer_id', '')}")
+                            if _TRACE_ENABLED:
+                                logger.debug(f"buffer_id {msg.get('buffer_id', '')}")
                             base64_data = msg.get("audio", "")
                             if not base64_data:
                                 continue
@@ -960,8 +1059,8 @@ async def flow_as_tool_websocket(
                             # Update modalities based on TTS choice
                             modalities = ["text"] if voice_config.use_elevenlabs else ["audio", "text"]
                             openai_realtime_session["modalities"] = modalities
-                            session_update = {"type": "session.update", "session": openai_realtime_session}
-                            msg_handler.openai_send(session_update)
+                            # session.update only changes the fields it carries, so skip resending instructions/tools
+                            msg_handler.openai_send({"type": "session.update", "session": {"modalities": modalities}})
                         elif msg.get("type") == "session.update":
                             openai_realtime_session = update_global_session(msg["session"])
                             session_update = {"type": "session.update", "session": openai_realtime_session}
@@ -981,7 +1080,14 @@ async def flow_as_tool_websocket(
                 try:
                     while True:
                         data = await openai_ws.recv()
-                        event = json.loads(data)
+                        # Binary frames skip the text peek and are parsed below, like any other event
+                        match = _LEADING_EVENT_TYPE.match(data) if isinstance(data, str) else None
+                        if match and match.group(1) in PASSTHROUGH_EVENT_TYPES:
+                            # Nothing below inspects these, so skip the parse and re-serialization
+                            log_event({"type": match.group(1)}, OPENAI_TO_LF)
+                            msg_handler.client_send_raw(data)
+                            continue
+                        event = orjson.loads(data)
                         log_event(event, OPENAI_TO_LF)
                         event_type = event.get("type")
                         response_id = event.get("response_id", None) or event.get("response", {}).get("id", None)
@@ -1153,7 +1259,7 @@ async def flow_tts_websocket(
         await client_websocket.accept()
 
         openai_send_q: asyncio.Queue[dict] = asyncio.Queue()
-        client_send_q: asyncio.Queue[dict] = asyncio.Queue()
+        client_send_q: ClientSendQueue = ClientSendQueue()
 
         log_event = create_event_logger()
 
@@ -1162,9 +1268,11 @@ async def flow_tts_websocket(
                 msg = await openai_send_q.get()
                 if msg is None:
                     break
-                logger.trace(f"Sending text {LF_TO_OPENAI}: {msg['type']}")
-                await openai_ws.send(json.dumps(msg))
-                logger.trace("JSON sent.")
+                if _TRACE_ENABLED:
+                    logger.debug(f"Sending text {LF_TO_OPENAI}: {msg['type']}")
+                await openai_ws.send(orjson.dumps(msg).decode())
+                if _TRACE_ENABLED:
+                    logger.debug("JSON sent.")
                 log_event(msg, LF_TO_OPENAI)
 
         async def client_writer():
@@ -1172,22 +1280,30 @@ async def flow_tts_websocket(
                 msg = await client_send_q.get()
                 if msg is None:
                     break
-                logger.trace(f"Sending JSON {LF_TO_CLIENT}: {msg['type']}")
-                await client_websocket.send_text(json.dumps(msg))
-                logger.trace("JSON sent.")
+                if isinstance(msg, str):
+                    await client_websocket.send_text(msg)
+                    continue
+                if _TRACE_ENABLED:
+                    logger.debug(f"Sending JSON {LF_TO_CLIENT}: {msg['type']}")
+                await client_websocket.send_text(orjson.dumps(msg).decode())
+                if _TRACE_ENABLED:
+                    logger.debug("JSON sent.")
                 log_event(msg, LF_TO_CLIENT)
 
         def openai_send(payload):
             log_event(payload, LF_TO_OPENAI)
-            logger.trace(f"Sending text {LF_TO_OPENAI}: {payload['type']}")
+            if _TRACE_ENABLED:
+                logger.debug(f"Queueing text {LF_TO_OPENAI}: {payload['type']}")
             openai_send_q.put_nowait(payload)
-            logger.trace("JSON sent.")
 
         def client_send(payload):
             log_event(payload, LF_TO_CLIENT)
-            logger.trace(f"Sending JSON {LF_TO_CLIENT}: {payload['type']}")
+            if _TRACE_ENABLED:
+                logger.debug(f"Queueing JSON {LF_TO_CLIENT}: {payload['type']}")
             client_send_q.put_nowait(payload)
-            logger.trace("JSON sent.")
+
+        def client_send_raw(text):
+            client_send_q.put_nowait(text)
 
         async def close():
             openai_send_q.put_nowait(None)
@@ -1206,7 +1322,7 @@ async def flow_tts_websocket(
         }
 
         tts_config = get_tts_config(session_id, openai_key)
-        async with websockets.connect(url, extra_headers=headers) as openai_ws:
+        async with websockets.connect(url, extra_headers=headers, compression=None) as openai_ws:
             openai_writer_task = asyncio.create_task(openai_writer())
             client_writer_task = asyncio.create_task(client_writer())
 
@@ -1218,7 +1334,7 @@ async def flow_tts_websocket(
                 try:
                     while True:
                         message_text = await client_websocket.receive_text()
-                        event = json.loads(message_text)
+                        event = orjson.loads(message_text)
                         if event.get("type") == "input_audio_buffer.append":
                             base64_data = event.get("audio", "")
                             if not base64_data:
@@ -1243,7 +1359,7 @@ async def flow_tts_websocket(
                 try:
                     while True:
                         data = await openai_ws.recv()
-                        event = json.loads(data)
+                        event = orjson.loads(data)
                         client_send(event)
                         if event.get("type") == "conversation.item.input_audio_transcription.completed":
                             transcript = event.get("transcript")
@@ -1261,17 +1377,10 @@ async def flow_tts_websocket(
                                 async for line in response.body_iterator:
                                     if not line:
                                         continue
-                                    event_data = json.loads(line)
+                                    event_data = orjson.loads(line)
                                     client_send({"type": "flow.build.progress", "data": event_data})
                                     if event_data.get("event") == "end_vertex":
-                                        text = (
-                                            event_data.get("data", {})
-                                            .get("build_data", "")
-                                            .get("data", {})
-                                            .get("results", {})
-                                            .get("message", {})
-                                            .get("text", "")
-                                        )
+                                        text = get_end_vertex_text(event_data)
                                         if text:
                                             result = text
                                 if result != "":
@@ -1281,7 +1390,7 @@ async def flow_tts_websocket(
                                         )
                                         if elevenlabs_client is None:
                                             return
-                                        audio_stream = elevenlabs_client.generate(
+                                        audio_stream = await elevenlabs_client.generate(
                                             voice=tts_config.elevenlabs_voice,
                                             output_format="pcm_24000",
                                             text=result,
@@ -1289,10 +1398,8 @@ async def flow_tts_websocket(
                                             voice_settings=None,
                                             stream=True,
                                         )
-                                        for chunk in audio_stream:
-                                            base64_audio = base64.b64encode(chunk).decode("utf-8")
-                                            audio_event = {"type": "response.audio.delta", "delta": base64_audio}
-                                            client_send(audio_event)
+                                        async for chunk in audio_stream:
+                                            client_send_raw(audio_delta_payload(chunk))
                                     else:
                                         oai_client = tts_config.get_openai_client()
                                         voice = tts_config.get_openai_voice()
@@ -1304,9 +1411,7 @@ async def flow_tts_websocket(
                                             response_format="pcm",
                                         )
 
-                                        base64_audio = base64.b64encode(response.content).decode("utf-8")
-                                        audio_event = {"type": "response.audio.delta", "delta": base64_audio}
-                                        client_send(audio_event)
+                                        client_send_raw(audio_delta_payload(response.content))
                 except Exception as e:  # noqa: BLE001
                     await logger.aerror(f"Error in WebSocket communication: {e}")
 
@@ -1351,7 +1456,7 @@ async def get_elevenlabs_voice_ids(
         if elevenlabs_client is None:
             return {"error": "ElevenLabs API key not found or invalid"}
 
-        voices_response = elevenlabs_client.voices.get_all()
+        voices_response = await elevenlabs_client.voices.get_all()
         voices = voices_response.voices
 
         # Fix for PERF401: Use list comprehension
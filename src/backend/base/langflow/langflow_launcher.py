@@ -11,6 +11,11 @@ def main():
     On macOS, sets required environment variables and replaces current process.
     On other platforms, calls main function directly.
     """
+    if sys.argv[1:2] in (["--version"], ["-v"]):
+        # Answer version queries without importing the CLI module or re-executing on macOS
+        _show_version()
+        return
+
     if platform.system() == "Darwin":  # macOS
         _launch_with_exec()
     else:
@@ -20,6 +25,16 @@ def main():
         langflow_main()
 
 
+def _show_version():
+    """Print the installed Langflow version, matching the output of `langflow --version`."""
+    from langflow.utils.version import get_version_info
+
+    default = "DEV"
+    raw_info = get_version_info()
+    version = raw_info.get("version", default) if raw_info else default
+    typer.echo(f"langflow {version}")
+
+
 def _launch_with_exec():
     """Launch langflow by replacing current process with properly configured environment.
 
@@ -1,6 +1,8 @@
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from enum import Enum
+from typing import Any
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from lfx.log.logger import logger
 from pydantic import BaseModel
@@ -22,27 +24,35 @@ class ArtifactType(str, Enum):
     MESSAGE = "message"
 
 
+def _message_artifact_type(value: Message) -> ArtifactType:
+    if not isinstance(value.text, str):
+        return ArtifactType(get_artifact_type(value.text))
+    return ArtifactType.MESSAGE
+
+
+def _data_artifact_type(value: Data) -> ArtifactType:
+    return ArtifactType(get_artifact_type(value.data))
+
+
+# Exact types resolve with one lookup; subclasses fall back to isinstance in this order (Message before Data)
+_ARTIFACT_TYPE_HANDLERS: dict[type, Callable[[Any], ArtifactType]] = {
+    Message: _message_artifact_type,
+    Data: _data_artifact_type,
+    str: lambda _: ArtifactType.TEXT,
+    dict: lambda _: ArtifactType.OBJECT,
+    list: lambda _: ArtifactType.ARRAY,
+    DataFrame: lambda _: ArtifactType.ARRAY,
+}
+
+
 def get_artifact_type(value, build_result=None) -> str:
-    result = ArtifactType.UNKNOWN
-    match value:
-        case Message():
-            if not isinstance(value.text, str):
-                enum_value = get_artifact_type(value.text)
-                result = ArtifactType(enum_value)
-            else:
-                result = ArtifactType.MESSAGE
-        case Data():
-            enum_value = get_artifact_type(value.data)
-            result = ArtifactType(enum_value)
-
-        case str():
-            result = ArtifactType.TEXT
-
-        case dict():
-            result = ArtifactType.OBJECT
-
-        case list() | DataFrame():
-            result = ArtifactType.ARRAY
+    handler = _ARTIFACT_TYPE_HANDLERS.get(type(value))
+    if handler is None:
+        handler = next(
+            (candidate for type_, candidate in _ARTIFACT_TYPE_HANDLERS.items() if isinstance(value, type_)),
+            None,
+        )
+    result = handler(value) if handler is not None else ArtifactType.UNKNOWN
     if result == ArtifactType.UNKNOWN and (
         (build_result and isinstance(build_result, Generator))
         or (isinstance(value, Message) and isinstance(value.text, Generator))
@@ -52,14 +62,40 @@ def get_artifact_type(value, build_result=None) -> str:
     return result.value
 
 
+def _item_serializer(item) -> Callable[[Any], Any]:
+    return serialize if hasattr(item, "dict") or hasattr(item, "model_dump") else str
+
+
 def _to_list_of_dicts(raw):
-    raw_ = []
-    for item in raw:
-        if hasattr(item, "dict") or hasattr(item, "model_dump"):
-            raw_.append(serialize(item))
-        else:
-            raw_.append(str(item))
-    return raw_
+    # The artifact type may come from the status rather than raw, so raw can be any iterable here
+    items = raw if isinstance(raw, list) else list(raw)
+    if not items:
+        return []
+    # Arrays are usually homogeneous: pick the serializer once instead of probing attributes on every item
+    first_type = type(items[0])
+    if all(type(item) is first_type for item in items):
+        serializer = _item_serializer(items[0])
+        return [serializer(item) for item in items]
+    return [_item_serializer(item)(item) for item in items]
+
+
+def _orjson_default(obj):
+    # Same precedence as jsonable_encoder: the custom encoders win over the pydantic dump
+    for type_, encoder in CUSTOM_ENCODERS.items():
+        if isinstance(obj, type_):
+            return encoder(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", by_alias=True)
+    raise TypeError
+
+
+def _encode_object(raw):
+    """Encodes a dict or model to JSON-compatible values, in C where orjson can handle every node."""
+    try:
+        return orjson.loads(orjson.dumps(raw, default=_orjson_default, option=orjson.OPT_PASSTHROUGH_DATETIME))
+    except orjson.JSONEncodeError:
+        # Non-str keys, sets, bytes, Decimals and the like keep jsonable_encoder's handling
+        return jsonable_encoder(raw, custom_encoder=CUSTOM_ENCODERS)
 
 
 def post_process_raw(raw, artifact_type: str):
@@ -72,7 +108,7 @@ def post_process_raw(raw, artifact_type: str):
     elif artifact_type == ArtifactType.UNKNOWN.value and raw is not None:
         if isinstance(raw, BaseModel | dict):
             try:
-                raw = jsonable_encoder(raw, custom_encoder=CUSTOM_ENCODERS)
+                raw = _encode_object(raw)
                 artifact_type = ArtifactType.OBJECT.value
             except Exception:  # noqa: BLE001
                 logger.debug(f"Error converting to json: {raw} ({type(raw)})", exc_info=True)
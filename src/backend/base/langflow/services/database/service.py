@@ -48,6 +48,7 @@ class DatabaseService(Service):
             msg = "No database URL provided"
             raise ValueError(msg)
         self.database_url: str = settings_service.settings.database_url
+        self._alembic_database_url: tuple[str, str] | None = None
         self._sanitize_database_url()
 
         # This file is in langflow.services.database.manager.py
@@ -123,6 +124,13 @@ class DatabaseService(Service):
 
         self.database_url = f"{driver}://{url_components[1]}"
 
+    @property
+    def alembic_database_url(self) -> str:
+        """The database URL with ``%`` escaped for Alembic's ConfigParser, cached until the URL changes."""
+        if self._alembic_database_url is None or self._alembic_database_url[0] != self.database_url:
+            self._alembic_database_url = (self.database_url, self.database_url.replace("%", "%%"))
+        return self._alembic_database_url[1]
+
     def _build_connection_kwargs(self):
         """Build connection kwargs by merging deprecated settings with db_connection_settings.
 
@@ -359,7 +367,7 @@ class DatabaseService(Service):
             alembic_cfg = Config(stdout=buffer)
             # alembic_cfg.attributes["connection"] = session
             alembic_cfg.set_main_option("script_location", str(self.script_location))
-            alembic_cfg.set_main_option("sqlalchemy.url", self.database_url.replace("%", "%%"))
+            alembic_cfg.set_main_option("sqlalchemy.url", self.alembic_database_url)
 
             if should_initialize_alembic:
                 try:
@@ -1,4 +1,5 @@
 import sqlalchemy as sa
+from alembic import op
 
 
 def table_exists(name, conn):
@@ -12,12 +13,44 @@ def table_exists(name, conn):
     bool: True if the table exists, False otherwise.
     """
     inspector = sa.inspect(conn)
-    return name in inspector.get_table_names()
+    # has_table probes the catalog for this one name instead of listing every table
+    return inspector.has_table(name)
+
+
+def get_column_names(table_name, conn):
+    """Get the names of the columns in a table.
+
+    Parameters:
+    table_name (str): The name of the table to inspect.
+    conn (sqlalchemy.engine.Engine or sqlalchemy.engine.Connection): The SQLAlchemy engine or connection to use.
+
+    Returns:
+    set[str]: The column names, as a set so several membership checks can share one reflection.
+    """
+    inspector = sa.inspect(conn)
+    return {column["name"] for column in inspector.get_columns(table_name)}
+
+
+_COLUMN_EXISTS_QUERIES = {
+    "sqlite": sa.text("SELECT 1 FROM pragma_table_info(:table_name) WHERE name = :column_name"),
+    "postgresql": sa.text(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = :table_name AND column_name = :column_name"
+    ),
+    "mysql": sa.text(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_schema = DATABASE() AND table_name = :table_name AND column_name = :column_name"
+    ),
+}
+_COLUMN_EXISTS_QUERIES["mariadb"] = _COLUMN_EXISTS_QUERIES["mysql"]
 
 
 def column_exists(table_name, column_name, conn):
     """Check if a column exists in a table.
 
+    On a live connection to SQLite, PostgreSQL, MySQL or MariaDB this is a single catalog query for the one
+    column; anything else falls back to reflecting the table.
+
     Parameters:
     table_name (str): The name of the table to check.
     column_name (str): The name of the column to check.
@@ -26,8 +59,101 @@ def column_exists(table_name, column_name, conn):
     Returns:
     bool: True if the column exists, False otherwise.
     """
-    inspector = sa.inspect(conn)
-    return column_name in [column["name"] for column in inspector.get_columns(table_name)]
+    if isinstance(conn, sa.engine.Connection):
+        query = _COLUMN_EXISTS_QUERIES.get(conn.dialect.name)
+        if query is not None:
+            params = {"table_name": table_name, "column_name": column_name}
+            return conn.execute(query, params).first() is not None
+    return column_name in get_column_names(table_name, conn)
+
+
+# Dialects that accept ADD COLUMN IF NOT EXISTS and DROP COLUMN IF EXISTS
+_IF_EXISTS_DIALECTS = frozenset({"postgresql", "mariadb"})
+
+
+def ensure_columns(table_name, columns, conn):
+    """Add columns to a table, skipping the ones that already exist.
+
+    PostgreSQL and MariaDB get a single ALTER TABLE with ADD COLUMN IF NOT EXISTS clauses, leaving the
+    existence check to the database instead of reflecting the table first. On SQLite all missing columns are added
+    in a single batch operation, so the table is rebuilt at most once. Other dialects support ALTER TABLE
+    natively and get plain add_column calls. Nothing is emitted when every column is already present.
+
+    Parameters:
+    table_name (str): The name of the table to alter.
+    columns (Iterable[sqlalchemy.Column]): The columns to add.
+    conn (sqlalchemy.engine.Connection): The SQLAlchemy connection to use.
+
+    Returns:
+    list[str]: The names of the columns that were added. When the database does the existence check
+    itself, every requested column is reported, since all of them are present afterwards.
+    """
+    columns = list(columns)
+    # CreateColumn does not render foreign keys, so those columns go through add_column instead
+    if conn.dialect.name in _IF_EXISTS_DIALECTS and not any(column.foreign_keys for column in columns):
+        if columns:
+            preparer = conn.dialect.identifier_preparer
+            adds = ", ".join(
+                f"ADD COLUMN IF NOT EXISTS {sa.schema.CreateColumn(column).compile(dialect=conn.dialect)}"
+                for column in columns
+            )
+            op.execute(f"ALTER TABLE {preparer.quote(table_name)} {adds}")
+        return [column.name for column in columns]
+    existing = get_column_names(table_name, conn)
+    missing = [column for column in columns if column.name not in existing]
+    if not missing:
+        return []
+    if conn.dialect.name == "sqlite":
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            for column in missing:
+                batch_op.add_column(column)
+    else:
+        for column in missing:
+            op.add_column(table_name, column)
+    return [column.name for column in missing]
+
+
+def drop_columns_if_exist(table_name, column_names, conn):
+    """Drop columns from a table, skipping the ones that do not exist.
+
+    PostgreSQL and MariaDB get a single ALTER TABLE with DROP COLUMN IF EXISTS clauses and no reflection.
+    Elsewhere the table is reflected first: SQLite uses a batch operation, MySQL drops several columns in
+    one ALTER TABLE statement so the table lock is taken once, and other dialects get plain drop_column
+    calls. Those paths return before emitting any DDL when none of the columns are present.
+
+    Parameters:
+    table_name (str): The name of the table to alter.
+    column_names (Iterable[str]): The names of the columns to drop.
+    conn (sqlalchemy.engine.Connection): The SQLAlchemy connection to use.
+
+    Returns:
+    list[str]: The names of the columns that were dropped. When the database does the existence check
+    itself, every requested name is reported, since none of them are present afterwards.
+    """
+    column_names = list(column_names)
+    if conn.dialect.name in _IF_EXISTS_DIALECTS:
+        if column_names:
+            preparer = conn.dialect.identifier_preparer
+            drops = ", ".join(f"DROP COLUMN IF EXISTS {preparer.quote(column_name)}" for column_name in column_names)
+            op.execute(f"ALTER TABLE {preparer.quote(table_name)} {drops}")
+        return column_names
+    existing = get_column_names(table_name, conn)
+    present = [column_name for column_name in column_names if column_name in existing]
+    if not present:
+        return []
+    dialect_name = conn.dialect.name
+    if dialect_name == "sqlite":
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            for column_name in present:
+                batch_op.drop_column(column_name)
+    elif len(present) > 1 and dialect_name == "mysql":
+        preparer = conn.dialect.identifier_preparer
+        drops = ", ".join(f"DROP COLUMN {preparer.quote(column_name)}" for column_name in present)
+        op.execute(f"ALTER TABLE {preparer.quote(table_name)} {drops}")
+    else:
+        for column_name in present:
+            op.drop_column(table_name, column_name)
+    return present
 
 
 def foreign_key_exists(table_name, fk_name, conn):
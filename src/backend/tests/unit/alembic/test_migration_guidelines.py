@@ -154,6 +154,33 @@ def downgrade():
         assert "MISSING_DATA_CHECK" in violations
         assert result["valid"] is False
 
+    def test_async_migration_functions_rejected(self, create_migration_file):
+        """Test that coroutine upgrade/downgrade functions are caught, since Alembic never awaits them."""
+        content = """
+\"\"\"
+Phase: EXPAND
+\"\"\"
+from alembic import op
+import sqlalchemy as sa
+
+async def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = [col['name'] for col in inspector.get_columns('users')]
+    if 'new_col' not in columns:
+        op.add_column('users', sa.Column('new_col', sa.String(), nullable=True))
+
+async def downgrade():
+    op.drop_column('users', 'new_col')
+"""
+        path = create_migration_file(content)
+        validator = MigrationValidator()
+        result = validator.validate_migration_file(path)
+
+        violations = [v["type"] for v in result["violations"]]
+        assert violations.count("ASYNC_MIGRATION_FUNCTION") == 2
+        assert result["valid"] is False
+
 
 class TestMigrationRuntimeGuidelines:
     """Tests proving that following the guidelines results in correct behavior.
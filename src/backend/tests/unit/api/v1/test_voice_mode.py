@@ -0,0 +1,187 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+import websockets
+from cachetools import TTLCache
+from langflow.api.v1 import voice_mode
+from langflow.api.v1.voice_mode import (
+    FLOW_DESC_TTL_SECONDS,
+    ClientSendQueue,
+    flow_as_tool_websocket,
+    get_flow_desc_from_db,
+)
+from starlette.websockets import WebSocketDisconnect
+
+
+def audio_delta(index: int) -> str:
+    return json.dumps({"type": "response.audio.delta", "delta": f"chunk-{index}"})
+
+
+def control_event(name: str) -> str:
+    return json.dumps({"type": name})
+
+
+def drain(queue: ClientSendQueue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_client_send_queue_never_drops_control_events():
+    queue = ClientSendQueue(max_audio=1)
+    items = [
+        control_event("response.created"),
+        {"type": "session.updated"},
+        audio_delta(0),
+        control_event("response.audio.done"),
+        audio_delta(1),
+        {"type": "response.done"},
+    ]
+    for item in items:
+        queue.put_nowait(item)
+
+    # Only the first audio delta is evicted; every control event and dict keeps its place
+    assert drain(queue) == [
+        control_event("response.created"),
+        {"type": "session.updated"},
+        control_event("response.audio.done"),
+        audio_delta(1),
+        {"type": "response.done"},
+    ]
+
+
+def test_client_send_queue_evicts_oldest_audio_delta():
+    queue = ClientSendQueue(max_audio=3)
+    for index in range(5):
+        queue.put_nowait(audio_delta(index))
+
+    assert drain(queue) == [audio_delta(2), audio_delta(3), audio_delta(4)]
+
+
+def test_client_send_queue_counts_audio_across_interleaved_put_and_get():
+    queue = ClientSendQueue(max_audio=2)
+
+    queue.put_nowait(audio_delta(0))
+    queue.put_nowait(control_event("response.created"))
+    assert queue.get_nowait() == audio_delta(0)
+    assert queue.get_nowait() == control_event("response.created")
+    assert queue._audio_pending == 0
+
+    # Getting from an audio-free queue must not push the counter below zero
+    queue.put_nowait(control_event("response.done"))
+    queue.get_nowait()
+    assert queue._audio_pending == 0
+
+    queue.put_nowait(audio_delta(1))
+    queue.put_nowait(audio_delta(2))
+    assert queue.get_nowait() == audio_delta(1)
+    queue.put_nowait(audio_delta(3))
+    assert queue._audio_pending == 2
+
+    # The backlog is full again, so only the oldest pending delta makes way
+    queue.put_nowait(audio_delta(4))
+    assert queue._audio_pending == 2
+    assert drain(queue) == [audio_delta(3), audio_delta(4)]
+    assert queue._audio_pending == 0
+
+
+@pytest.fixture
+def flow_desc_clock(monkeypatch):
+    clock = [0.0]
+    cache = TTLCache(maxsize=8, ttl=FLOW_DESC_TTL_SECONDS, timer=lambda: clock[0])
+    monkeypatch.setattr(voice_mode, "_flow_desc_cache", cache)
+    return clock
+
+
+def mock_session(row):
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    session = MagicMock()
+    session.exec = AsyncMock(return_value=result)
+    return session
+
+
+async def test_get_flow_desc_from_db_serves_repeat_calls_from_cache(flow_desc_clock):
+    flow_id = str(uuid4())
+    session = mock_session(("A helpful flow",))
+
+    assert await get_flow_desc_from_db(flow_id, session) == "A helpful flow"
+    flow_desc_clock[0] += FLOW_DESC_TTL_SECONDS - 1
+    assert await get_flow_desc_from_db(flow_id, session) == "A helpful flow"
+
+    session.exec.assert_awaited_once()
+
+
+@pytest.mark.usefixtures("flow_desc_clock")
+async def test_get_flow_desc_from_db_caches_missing_description():
+    flow_id = str(uuid4())
+    session = mock_session((None,))
+
+    assert await get_flow_desc_from_db(flow_id, session) is None
+    assert await get_flow_desc_from_db(flow_id, session) is None
+
+    session.exec.assert_awaited_once()
+
+
+async def test_get_flow_desc_from_db_requeries_after_ttl(flow_desc_clock):
+    flow_id = str(uuid4())
+    session = mock_session(("Old description",))
+    await get_flow_desc_from_db(flow_id, session)
+
+    flow_desc_clock[0] += FLOW_DESC_TTL_SECONDS
+    session.exec.return_value.one_or_none.return_value = ("New description",)
+
+    assert await get_flow_desc_from_db(flow_id, session) == "New description"
+    assert session.exec.await_count == 2
+
+
+@pytest.mark.usefixtures("flow_desc_clock")
+async def test_get_flow_desc_from_db_raises_for_unknown_flow():
+    flow_id = str(uuid4())
+    session = mock_session(None)
+
+    with pytest.raises(ValueError, match=f"Flow with id {flow_id} not found"):
+        await get_flow_desc_from_db(flow_id, session)
+
+    # Lookups that fail are not cached
+    with pytest.raises(ValueError, match="not found"):
+        await get_flow_desc_from_db(flow_id, session)
+    assert session.exec.await_count == 2
+
+
+async def test_flow_as_tool_forwards_binary_openai_frames():
+    text_delta = audio_delta(0)
+    binary_delta = json.dumps({"type": "response.audio.delta", "delta": "binary-chunk"}).encode()
+
+    openai_ws = MagicMock()
+    openai_ws.send = AsyncMock()
+    openai_ws.close = AsyncMock()
+    openai_ws.recv = AsyncMock(side_effect=[text_delta, binary_delta, websockets.ConnectionClosedOK(None, None)])
+    connection = MagicMock()
+    connection.__aenter__.return_value = openai_ws
+
+    client_ws = MagicMock()
+    client_ws.accept = AsyncMock()
+    client_ws.send_text = AsyncMock()
+    client_ws.close = AsyncMock()
+    client_ws.receive_text = AsyncMock(side_effect=WebSocketDisconnect())
+
+    user = MagicMock()
+    with (
+        patch.object(voice_mode, "get_current_user_for_websocket", AsyncMock(return_value=user)),
+        patch.object(voice_mode, "authenticate_and_get_openai_key", AsyncMock(return_value=(user, "sk-test"))),
+        patch.object(voice_mode, "get_flow_desc_from_db", AsyncMock(return_value="A flow")),
+        patch.object(voice_mode.websockets, "connect", return_value=connection),
+    ):
+        await flow_as_tool_websocket(client_ws, str(uuid4()), MagicMock(), MagicMock(), str(uuid4()))
+
+    sent = [json.loads(call.args[0]) for call in client_ws.send_text.await_args_list]
+    # The text frame is relayed untouched and the binary frame is parsed, so the forwarder survives both
+    assert [event["delta"] for event in sent if event["type"] == "response.audio.delta"] == [
+        "chunk-0",
+        "binary-chunk",
+    ]
+    assert openai_ws.recv.await_count == 3
@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from lfx.components.datastax import astradb_cql
+from lfx.components.datastax.astradb_cql import VOLATILE_MARKER, AstraDBCQLToolComponent
+
+TOOLS_PARAMS = [
+    {
+        "name": "customer_id",
+        "field_name": "",
+        "description": "Customer id",
+        "mandatory": True,
+        "is_timestamp": False,
+        "operator": "$eq",
+    }
+]
+
+
+def json_response(rows):
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"data": rows}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def empty_rest_cache():
+    astradb_cql._REST_CACHE.clear()
+    yield
+    astradb_cql._REST_CACHE.clear()
+
+
+@pytest.fixture
+def http_get():
+    with patch.object(astradb_cql, "get_http_client") as mock_client:
+        yield mock_client.return_value.get
+
+
+@pytest.fixture
+def component():
+    component = AstraDBCQLToolComponent()
+    component.set_attributes(
+        {
+            "token": "token-a",
+            "collection_name": "orders",
+            "tool_name": "orders_lookup",
+            "tools_params": TOOLS_PARAMS,
+            "static_filters": {},
+            "projection_fields": "*",
+            "number_of_results": 5,
+        }
+    )
+    with (
+        patch.object(AstraDBCQLToolComponent, "get_api_endpoint", return_value="https://db.example.com"),
+        patch.object(AstraDBCQLToolComponent, "get_keyspace", return_value="default_keyspace"),
+    ):
+        yield component
+
+
+def test_repeated_call_is_served_from_cache(component, http_get):
+    http_get.return_value = json_response([{"customer_id": "1", "total": 10}])
+
+    first = component.astra_rest({"customer_id": "1"})
+    second = component.astra_rest({"customer_id": "1"})
+
+    assert first == second == [{"customer_id": "1", "total": 10}]
+    http_get.assert_called_once()
+
+
+def test_different_where_or_token_misses(component, http_get):
+    http_get.return_value = json_response([{"customer_id": "1"}])
+
+    component.astra_rest({"customer_id": "1"})
+    component.astra_rest({"customer_id": "2"})
+    component.set_attributes({"token": "token-b"})
+    component.astra_rest({"customer_id": "1"})
+
+    assert http_get.call_count == 3
+
+
+def test_error_response_is_not_cached(component, http_get):
+    error = MagicMock(status_code=500, text="boom")
+    http_get.side_effect = [error, json_response([{"customer_id": "1"}])]
+
+    with pytest.raises(ValueError, match="boom"):
+        component.astra_rest({"customer_id": "1"})
+
+    assert component.astra_rest({"customer_id": "1"}) == [{"customer_id": "1"}]
+    assert http_get.call_count == 2
+
+
+def test_non_json_response_is_not_cached(component, http_get):
+    not_json = MagicMock(status_code=204)
+    not_json.json.side_effect = ValueError("no body")
+    http_get.side_effect = [not_json, json_response([{"customer_id": "1"}])]
+
+    assert component.astra_rest({"customer_id": "1"}) == 204
+    assert component.astra_rest({"customer_id": "1"}) == [{"customer_id": "1"}]
+    assert http_get.call_count == 2
+
+
+def test_mutating_returned_rows_does_not_affect_cache(component, http_get):
+    http_get.return_value = json_response([{"customer_id": "1", "tags": ["a"]}])
+
+    rows = component.astra_rest({"customer_id": "1"})
+    rows[0]["tags"].append("mutated")
+    rows.append({"customer_id": "extra"})
+
+    assert component.astra_rest({"customer_id": "1"}) == [{"customer_id": "1", "tags": ["a"]}]
+    http_get.assert_called_once()
+
+
+def test_volatile_marker_bypasses_cache(component, http_get):
+    http_get.return_value = json_response([{"customer_id": "1"}])
+    component.set_attributes({"static_filters": {VOLATILE_MARKER: True}})
+
+    component.astra_rest({"customer_id": "1"})
+    component.astra_rest({"customer_id": "1"})
+
+    assert http_get.call_count == 2
+    assert not astradb_cql._REST_CACHE
@@ -1,7 +1,8 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
-from lfx.components.data_source.url import URLComponent
+from langchain_community.document_loaders import RecursiveUrlLoader
+from lfx.components.data_source.url import HostLimitedUrlLoader, URLComponent, html_to_text
 from lfx.schema import DataFrame
 
 from tests.base import ComponentTestBaseWithoutClient
@@ -227,3 +228,73 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         # Test invalid URL
         with pytest.raises(ValueError, match="Invalid URL"):
             component.ensure_url("not a url")
+
+    def test_html_to_text(self):
+        """Test the lxml text extractor used for the Text format."""
+        html = (
+            "<html><head><title>Title</title><style>p {}</style><script>var x = 1;</script></head>"
+            "<body><nav><a href='/'>Home</a></nav><!-- note --><p>Hello <b>world</b></p>"
+            "<template>hidden</template><noscript>Enable JavaScript</noscript>tail</body></html>"
+        )
+        assert html_to_text(html) == "TitleHello worldtail"
+
+        # Pages lxml refuses to parse fall back to BeautifulSoup
+        assert html_to_text("") == ""
+        assert html_to_text('<?xml version="1.0" encoding="utf-8"?><html><body>text</body></html>') == "text"
+
+    def test_url_component_limits_connections_per_host(self):
+        """Test the loader is created with the configured per-host connection limit."""
+        component = URLComponent()
+        component.set_attributes({"urls": ["https://example.com"], "max_connections_per_host": 3})
+
+        loader = component._create_loader("https://example.com")
+        assert isinstance(loader, HostLimitedUrlLoader)
+        assert loader.max_connections_per_host == 3
+
+    def test_host_limited_loader_crawls_through_one_limited_session(self):
+        """Test the async crawl opens one per-host limited session and reuses it for every child link."""
+        pages = {
+            "https://example.com": '<html><body>root<a href="/a">a</a><a href="/b">b</a></body></html>',
+            "https://example.com/a": "<html><body>page a</body></html>",
+            "https://example.com/b": "<html><body>page b</body></html>",
+        }
+
+        def fake_get(url, **_kwargs):
+            response = MagicMock(status=200, headers={"Content-Type": "text/html"})
+            response.text = AsyncMock(return_value=pages[url])
+            context = MagicMock()
+            context.__aenter__.return_value = response
+            return context
+
+        session = MagicMock()
+        session.get.side_effect = fake_get
+
+        loader = HostLimitedUrlLoader(
+            url="https://example.com",
+            max_depth=2,
+            use_async=True,
+            extractor=html_to_text,
+            max_connections_per_host=3,
+        )
+        with (
+            patch("lfx.components.data_source.url.aiohttp.TCPConnector") as mock_connector,
+            patch("lfx.components.data_source.url.aiohttp.ClientSession") as mock_session_cls,
+            patch.object(
+                RecursiveUrlLoader,
+                "_async_get_child_links_recursive",
+                autospec=True,
+                side_effect=RecursiveUrlLoader._async_get_child_links_recursive,
+            ) as spy,
+        ):
+            mock_session_cls.return_value.__aenter__.return_value = session
+            docs = loader.load()
+
+        assert sorted(doc.page_content for doc in docs) == ["page a", "page b", "rootab"]
+        mock_connector.assert_called_once()
+        assert mock_connector.call_args.kwargs["limit_per_host"] == 3
+        mock_session_cls.assert_called_once()
+        assert mock_session_cls.call_args.kwargs["connector"] is mock_connector.return_value
+        # The root and both children are fetched through the single limited session
+        assert session.get.call_count == 3
+        assert spy.call_count == 3
+        assert all(call.kwargs["session"] is session for call in spy.call_args_list)
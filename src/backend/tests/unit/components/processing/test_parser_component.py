@@ -223,6 +223,40 @@ class TestParserComponent(ComponentTestBaseWithoutClient):
         expected = "John is 30 years old | Jane is 25 years old | Bob is 35 years old"
         assert result.text == expected
 
+    def test_dataframe_keeps_column_types(self, component_class):
+        # Arrange - an all-numeric row read as a Series would upcast the int column to float
+        data_frame = DataFrame({"Age": [30, 25], "Score": [9.5, 8.0]})
+        kwargs = {
+            "input_data": data_frame,
+            "pattern": "{Age}: {Score}",
+            "sep": "\n",
+            "mode": "Parser",
+        }
+        component = component_class(**kwargs)
+
+        # Act
+        result = component.parse_combined_text()
+
+        # Assert
+        assert result.text == "30: 9.5\n25: 8.0"
+
+    def test_dataframe_template_without_placeholders(self, component_class):
+        # Arrange - no fields to fill, only an escaped brace
+        data_frame = DataFrame({"Name": ["John", "Jane", "Bob"]})
+        kwargs = {
+            "input_data": data_frame,
+            "pattern": "{{row}}",
+            "sep": ", ",
+            "mode": "Parser",
+        }
+        component = component_class(**kwargs)
+
+        # Act
+        result = component.parse_combined_text()
+
+        # Assert
+        assert result.text == "{row}, {row}, {row}"
+
     def test_empty_data_with_template(self, component_class):
         # Arrange - Data with empty data dict but template expects keys
         data = Data(text_key="text", data={}, default_value="")
@@ -2,7 +2,29 @@ from unittest.mock import Mock, patch
 
 import pytest
 import sqlalchemy as sa
-from langflow.utils.migration import column_exists, constraint_exists, foreign_key_exists, table_exists
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from langflow.utils.migration import (
+    column_exists,
+    constraint_exists,
+    drop_columns_if_exist,
+    ensure_columns,
+    foreign_key_exists,
+    get_column_names,
+    table_exists,
+)
+from sqlalchemy.dialects import mysql, postgresql
+
+
+@pytest.fixture
+def sqlite_migration_conn():
+    """A SQLite connection with an Alembic operations context, as seen inside a revision."""
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(sa.text("CREATE TABLE task (id INTEGER PRIMARY KEY, name VARCHAR)"))
+        with Operations.context(MigrationContext.configure(conn)):
+            yield conn
+    engine.dispose()
 
 
 class TestTableExists:
@@ -12,7 +34,7 @@ class TestTableExists:
     def test_table_exists_true(self, mock_inspect):
         """Test when table exists."""
         mock_inspector = Mock()
-        mock_inspector.get_table_names.return_value = ["users", "posts", "comments"]
+        mock_inspector.has_table.return_value = True
         mock_inspect.return_value = mock_inspector
 
         mock_conn = Mock()
@@ -21,13 +43,14 @@ class TestTableExists:
 
         assert result is True
         mock_inspect.assert_called_once_with(mock_conn)
-        mock_inspector.get_table_names.assert_called_once()
+        mock_inspector.has_table.assert_called_once_with("users")
+        mock_inspector.get_table_names.assert_not_called()
 
     @patch("sqlalchemy.inspect")
     def test_table_exists_false(self, mock_inspect):
         """Test when table does not exist."""
         mock_inspector = Mock()
-        mock_inspector.get_table_names.return_value = ["users", "posts", "comments"]
+        mock_inspector.has_table.return_value = False
         mock_inspect.return_value = mock_inspector
 
         mock_conn = Mock()
@@ -36,13 +59,13 @@ class TestTableExists:
 
         assert result is False
         mock_inspect.assert_called_once_with(mock_conn)
-        mock_inspector.get_table_names.assert_called_once()
+        mock_inspector.has_table.assert_called_once_with("nonexistent_table")
 
     @patch("sqlalchemy.inspect")
     def test_table_exists_empty_database(self, mock_inspect):
         """Test when database has no tables."""
         mock_inspector = Mock()
-        mock_inspector.get_table_names.return_value = []
+        mock_inspector.has_table.return_value = False
         mock_inspect.return_value = mock_inspector
 
         mock_conn = Mock()
@@ -51,13 +74,13 @@ class TestTableExists:
 
         assert result is False
         mock_inspect.assert_called_once_with(mock_conn)
-        mock_inspector.get_table_names.assert_called_once()
+        mock_inspector.has_table.assert_called_once_with("any_table")
 
     @patch("sqlalchemy.inspect")
     def test_table_exists_case_sensitive(self, mock_inspect):
         """Test case sensitivity of table name matching."""
         mock_inspector = Mock()
-        mock_inspector.get_table_names.return_value = ["Users", "posts"]
+        mock_inspector.has_table.side_effect = lambda name: name in ["Users", "posts"]
         mock_inspect.return_value = mock_inspector
 
         mock_conn = Mock()
@@ -74,7 +97,7 @@ class TestTableExists:
     def test_table_exists_with_engine(self, mock_inspect):
         """Test function works with both engine and connection objects."""
         mock_inspector = Mock()
-        mock_inspector.get_table_names.return_value = ["test_table"]
+        mock_inspector.has_table.return_value = True
         mock_inspect.return_value = mock_inspector
 
         mock_engine = Mock(spec=sa.engine.Engine)
@@ -85,6 +108,37 @@ class TestTableExists:
         mock_inspect.assert_called_once_with(mock_engine)
 
 
+class TestGetColumnNames:
+    """Test cases for get_column_names function."""
+
+    @patch("sqlalchemy.inspect")
+    def test_get_column_names_returns_set(self, mock_inspect):
+        """Test that column names are returned as a set from a single reflection."""
+        mock_inspector = Mock()
+        mock_inspector.get_columns.return_value = [
+            {"name": "id", "type": "INTEGER"},
+            {"name": "username", "type": "VARCHAR"},
+        ]
+        mock_inspect.return_value = mock_inspector
+
+        mock_conn = Mock()
+
+        result = get_column_names("users", mock_conn)
+
+        assert result == {"id", "username"}
+        mock_inspect.assert_called_once_with(mock_conn)
+        mock_inspector.get_columns.assert_called_once_with("users")
+
+    @patch("sqlalchemy.inspect")
+    def test_get_column_names_empty_table(self, mock_inspect):
+        """Test when table has no columns."""
+        mock_inspector = Mock()
+        mock_inspector.get_columns.return_value = []
+        mock_inspect.return_value = mock_inspector
+
+        assert get_column_names("empty_table", Mock()) == set()
+
+
 class TestColumnExists:
     """Test cases for column_exists function."""
 
@@ -184,6 +238,163 @@ class TestColumnExists:
         assert mock_inspect.call_count == 4
         assert mock_inspector.get_columns.call_count == 4
 
+    def test_column_exists_queries_catalog_on_live_connection(self, sqlite_migration_conn):
+        """Test that a live SQLite connection is answered from the catalog without reflection."""
+        with patch("langflow.utils.migration.sa.inspect") as mock_inspect:
+            assert column_exists("task", "name", sqlite_migration_conn) is True
+            assert column_exists("task", "review", sqlite_migration_conn) is False
+            assert column_exists("missing_table", "name", sqlite_migration_conn) is False
+
+        mock_inspect.assert_not_called()
+
+
+class TestEnsureColumns:
+    """Test cases for ensure_columns function."""
+
+    def test_adds_all_missing_columns(self, sqlite_migration_conn):
+        """Test that every missing column is added."""
+        added = ensure_columns(
+            "task",
+            [sa.Column("review", sa.JSON(), nullable=True), sa.Column("review_history", sa.JSON(), nullable=True)],
+            sqlite_migration_conn,
+        )
+
+        assert added == ["review", "review_history"]
+        assert get_column_names("task", sqlite_migration_conn) == {"id", "name", "review", "review_history"}
+
+    def test_skips_existing_columns(self, sqlite_migration_conn):
+        """Test that columns already present are left alone."""
+        added = ensure_columns(
+            "task",
+            [sa.Column("name", sa.String(), nullable=True), sa.Column("review", sa.JSON(), nullable=True)],
+            sqlite_migration_conn,
+        )
+
+        assert added == ["review"]
+
+    def test_no_batch_operation_when_nothing_is_missing(self, sqlite_migration_conn):
+        """Test that no batch operation is opened when all columns exist."""
+        with patch("langflow.utils.migration.op") as mock_op:
+            added = ensure_columns("task", [sa.Column("name", sa.String(), nullable=True)], sqlite_migration_conn)
+
+        assert added == []
+        mock_op.batch_alter_table.assert_not_called()
+
+    @patch("langflow.utils.migration.get_column_names", return_value={"id"})
+    def test_uses_plain_add_column_outside_sqlite(self, mock_get_column_names):
+        """Test that dialects with native ALTER TABLE skip the batch operation."""
+        mock_conn = Mock()
+        mock_conn.dialect.name = "mysql"
+        review = sa.Column("review", sa.JSON(), nullable=True)
+
+        with patch("langflow.utils.migration.op") as mock_op:
+            added = ensure_columns("task", [review], mock_conn)
+
+        assert added == ["review"]
+        mock_get_column_names.assert_called_once_with("task", mock_conn)
+        mock_op.add_column.assert_called_once_with("task", review)
+        mock_op.batch_alter_table.assert_not_called()
+
+    @patch("langflow.utils.migration.get_column_names")
+    def test_adds_columns_if_not_exists_on_postgresql(self, mock_get_column_names):
+        """Test that PostgreSQL leaves the existence check to the database in one statement."""
+        mock_conn = Mock()
+        mock_conn.dialect = postgresql.dialect()
+
+        with patch("langflow.utils.migration.op") as mock_op:
+            added = ensure_columns(
+                "task",
+                [
+                    sa.Column("review", sa.JSON(), nullable=True),
+                    sa.Column("archived", sa.Boolean(), nullable=False, server_default=sa.false()),
+                ],
+                mock_conn,
+            )
+
+        assert added == ["review", "archived"]
+        mock_get_column_names.assert_not_called()
+        mock_op.execute.assert_called_once_with(
+            "ALTER TABLE task ADD COLUMN IF NOT EXISTS review JSON, "
+            "ADD COLUMN IF NOT EXISTS archived BOOLEAN DEFAULT false NOT NULL"
+        )
+        mock_op.add_column.assert_not_called()
+
+    @patch("langflow.utils.migration.get_column_names", return_value={"id"})
+    def test_foreign_key_columns_use_add_column_on_postgresql(self, mock_get_column_names):  # noqa: ARG002
+        """Test that columns with foreign keys keep add_column so the constraint is created."""
+        mock_conn = Mock()
+        mock_conn.dialect = postgresql.dialect()
+        owner = sa.Column("owner_id", sa.Integer(), sa.ForeignKey("user.id"), nullable=True)
+
+        with patch("langflow.utils.migration.op") as mock_op:
+            added = ensure_columns("task", [owner], mock_conn)
+
+        assert added == ["owner_id"]
+        mock_op.add_column.assert_called_once_with("task", owner)
+        mock_op.execute.assert_not_called()
+
+
+class TestDropColumnsIfExist:
+    """Test cases for drop_columns_if_exist function."""
+
+    def test_drops_only_present_columns(self, sqlite_migration_conn):
+        """Test that present columns are dropped and missing ones are ignored."""
+        dropped = drop_columns_if_exist("task", ["name", "review"], sqlite_migration_conn)
+
+        assert dropped == ["name"]
+        assert get_column_names("task", sqlite_migration_conn) == {"id"}
+
+    def test_no_batch_operation_when_nothing_is_present(self, sqlite_migration_conn):
+        """Test that no batch operation is opened when none of the columns exist."""
+        with patch("langflow.utils.migration.op") as mock_op:
+            dropped = drop_columns_if_exist("task", ["review", "review_history"], sqlite_migration_conn)
+
+        assert dropped == []
+        mock_op.batch_alter_table.assert_not_called()
+
+    @patch("langflow.utils.migration.get_column_names", return_value={"id", "review"})
+    def test_uses_plain_drop_column_outside_sqlite(self, mock_get_column_names):  # noqa: ARG002
+        """Test that dialects with native ALTER TABLE skip the batch operation."""
+        mock_conn = Mock()
+        mock_conn.dialect.name = "mysql"
+
+        with patch("langflow.utils.migration.op") as mock_op:
+            dropped = drop_columns_if_exist("task", ["review", "review_history"], mock_conn)
+
+        assert dropped == ["review"]
+        mock_op.drop_column.assert_called_once_with("task", "review")
+        mock_op.batch_alter_table.assert_not_called()
+
+    @patch("langflow.utils.migration.get_column_names", return_value={"id", "review", "review_history"})
+    def test_drops_several_columns_in_one_statement_on_mysql(self, mock_get_column_names):  # noqa: ARG002
+        """Test that MySQL drops all present columns with a single ALTER TABLE."""
+        mock_conn = Mock()
+        mock_conn.dialect = mysql.dialect()
+
+        with patch("langflow.utils.migration.op") as mock_op:
+            dropped = drop_columns_if_exist("task", ["review_history", "review", "missing"], mock_conn)
+
+        assert dropped == ["review_history", "review"]
+        mock_op.execute.assert_called_once_with("ALTER TABLE task DROP COLUMN review_history, DROP COLUMN review")
+        mock_op.drop_column.assert_not_called()
+        mock_op.batch_alter_table.assert_not_called()
+
+    @patch("langflow.utils.migration.get_column_names")
+    def test_drops_columns_if_exists_on_postgresql(self, mock_get_column_names):
+        """Test that PostgreSQL leaves the existence check to the database in one statement."""
+        mock_conn = Mock()
+        mock_conn.dialect = postgresql.dialect()
+
+        with patch("langflow.utils.migration.op") as mock_op:
+            dropped = drop_columns_if_exist("task", ["review_history", "review"], mock_conn)
+
+        assert dropped == ["review_history", "review"]
+        mock_get_column_names.assert_not_called()
+        mock_op.execute.assert_called_once_with(
+            "ALTER TABLE task DROP COLUMN IF EXISTS review_history, DROP COLUMN IF EXISTS review"
+        )
+        mock_op.drop_column.assert_not_called()
+
 
 class TestForeignKeyExists:
     """Test cases for foreign_key_exists function."""
@@ -399,8 +610,8 @@ class TestIntegrationScenarios:
         mock_inspector = Mock()
 
         # Setup mock responses for different calls
-        def get_table_names_side_effect():
-            return ["users", "posts", "comments", "categories"]
+        def has_table_side_effect(table_name):
+            return table_name in ["users", "posts", "comments", "categories"]
 
         def get_columns_side_effect(table_name):
             columns_map = {
@@ -432,7 +643,7 @@ class TestIntegrationScenarios:
             }
             return constraint_map.get(table_name, [])
 
-        mock_inspector.get_table_names.side_effect = get_table_names_side_effect
+        mock_inspector.has_table.side_effect = has_table_side_effect
         mock_inspector.get_columns.side_effect = get_columns_side_effect
         mock_inspector.get_foreign_keys.side_effect = get_foreign_keys_side_effect
         mock_inspector.get_unique_constraints.side_effect = get_unique_constraints_side_effect
@@ -465,7 +676,7 @@ class TestIntegrationScenarios:
     def test_error_handling_in_inspection(self, mock_inspect):
         """Test error handling when SQLAlchemy inspection fails."""
         mock_inspector = Mock()
-        mock_inspector.get_table_names.side_effect = Exception("Database connection error")
+        mock_inspector.has_table.side_effect = Exception("Database connection error")
         mock_inspect.return_value = mock_inspector
 
         mock_conn = Mock()
@@ -478,7 +689,7 @@ class TestIntegrationScenarios:
     def test_with_different_connection_types(self, mock_inspect):
         """Test functions work with different SQLAlchemy connection types."""
         mock_inspector = Mock()
-        mock_inspector.get_table_names.return_value = ["test_table"]
+        mock_inspector.has_table.return_value = True
         mock_inspect.return_value = mock_inspector
 
         # Test with mock engine
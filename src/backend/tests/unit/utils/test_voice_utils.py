@@ -12,6 +12,8 @@ from langflow.utils.voice_utils import (
     VAD_SAMPLE_RATE_16K,
     _write_bytes_to_file,
     resample_24k_to_16k,
+    resample_24k_to_16k_frames,
+    split_sentences,
     write_audio_to_file,
 )
 
@@ -153,23 +155,99 @@ class TestResample24kTo16k:
         ratio = len(result_samples) / len(samples_24k)
         assert abs(ratio - 2 / 3) < 0.001
 
-    @patch("langflow.utils.voice_utils.resample")
-    def test_resample_function_called(self, mock_resample):
-        """Test that scipy.signal.resample is called correctly."""
-        mock_resample.return_value = np.zeros(320, dtype=np.int16)
+    @patch("langflow.utils.voice_utils.resample_poly")
+    def test_resample_function_called(self, mock_resample_poly):
+        """Test that scipy.signal.resample_poly is called with the 2/3 ratio."""
+        mock_resample_poly.return_value = np.zeros(320, dtype=np.float64)
 
         samples_24k = np.zeros(480, dtype=np.int16)
         frame_24k_bytes = samples_24k.tobytes()
 
         resample_24k_to_16k(frame_24k_bytes)
 
-        # Verify resample was called with correct parameters
-        mock_resample.assert_called_once()
-        args, _ = mock_resample.call_args
-        input_array, target_samples = args
+        # Verify resample_poly was called with correct parameters
+        mock_resample_poly.assert_called_once()
+        args, kwargs = mock_resample_poly.call_args
+        (input_array,) = args
 
         assert len(input_array) == 480
-        assert target_samples == 320  # int(480 * 2 / 3)
+        assert kwargs["up"] == 2
+        assert kwargs["down"] == 3
+
+    def test_resample_matches_frames_helper(self):
+        """Test that a single frame resamples exactly like a one-frame run."""
+        rng = np.random.default_rng()
+        frame_24k_bytes = rng.integers(-32768, 32767, 480, dtype=np.int16).tobytes()
+
+        assert resample_24k_to_16k(frame_24k_bytes) == resample_24k_to_16k_frames(frame_24k_bytes)
+
+
+class TestResample24kTo16kFrames:
+    """Test cases for resample_24k_to_16k_frames function."""
+
+    def test_resample_multiple_frames(self):
+        """Test that a run of frames keeps its frame count."""
+        rng = np.random.default_rng(seed=0)
+        frames_24k_bytes = rng.integers(-32768, 32767, 480 * 5, dtype=np.int16).tobytes()
+
+        result = resample_24k_to_16k_frames(frames_24k_bytes)
+
+        assert len(result) == 5 * BYTES_PER_16K_FRAME
+
+    def test_resample_frames_accepts_bytearray(self):
+        """Test that the audio buffer can be passed without copying it to bytes first."""
+        frames_24k = bytearray(BYTES_PER_24K_FRAME * 2)
+
+        result = resample_24k_to_16k_frames(frames_24k)
+
+        assert result == bytes(BYTES_PER_16K_FRAME * 2)
+
+    def test_resample_frames_preserves_sine_wave(self):
+        """Test that a low-frequency tone survives resampling close to its original shape."""
+        t_24k = np.arange(480 * 10) / SAMPLE_RATE_24K
+        samples_24k = (10000 * np.sin(2 * np.pi * 440 * t_24k)).astype(np.int16)
+
+        result = np.frombuffer(resample_24k_to_16k_frames(samples_24k.tobytes()), dtype=np.int16)
+
+        t_16k = np.arange(320 * 10) / VAD_SAMPLE_RATE_16K
+        expected = 10000 * np.sin(2 * np.pi * 440 * t_16k)
+        # Ignore the filter's edge transients
+        assert np.max(np.abs(result[100:-100] - expected[100:-100])) < 200
+
+    def test_resample_frames_partial_frame(self):
+        """Test that a trailing partial frame raises ValueError."""
+        with pytest.raises(ValueError, match="Expected a multiple of 960 bytes"):
+            resample_24k_to_16k_frames(b"\x00" * (BYTES_PER_24K_FRAME + 2))
+
+    def test_resample_frames_empty(self):
+        """Test that no frames in gives no frames out."""
+        assert resample_24k_to_16k_frames(b"") == b""
+
+
+class TestSplitSentences:
+    """Test cases for split_sentences function."""
+
+    def test_split_sentences_keeps_order_across_delimiters(self):
+        """Test that mixed delimiters come out in text order."""
+        sentences, rest = split_sentences("Hi. Are you there? Yes; good! And")
+
+        assert sentences == ["Hi.", " Are you there?", " Yes;", " good!"]
+        assert rest == " And"
+
+    def test_split_sentences_without_delimiter(self):
+        """Test that text with no delimiter is all remainder."""
+        assert split_sentences("still talking") == ([], "still talking")
+
+    def test_split_sentences_consecutive_delimiters(self):
+        """Test that back-to-back delimiters each close a chunk."""
+        sentences, rest = split_sentences("Wait...")
+
+        assert "".join(sentences) == "Wait..."
+        assert rest == ""
+
+    def test_split_sentences_empty(self):
+        """Test that empty text splits into nothing."""
+        assert split_sentences("") == ([], "")
 
 
 class TestWriteAudioToFile:
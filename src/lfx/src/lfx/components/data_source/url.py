@@ -1,9 +1,13 @@
 import importlib
 import re
+from concurrent.futures import ThreadPoolExecutor
 
+import aiohttp
+import lxml.html
 import requests
 from bs4 import BeautifulSoup
 from langchain_community.document_loaders import RecursiveUrlLoader
+from lxml import etree
 
 from lfx.custom.custom_component.component import Component
 from lfx.field_typing.range_spec import RangeSpec
@@ -18,6 +22,9 @@ from lfx.utils.request_utils import get_user_agent
 DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_DEPTH = 1
 DEFAULT_FORMAT = "Text"
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+# Root URLs crawled at the same time; each crawl is network-bound and runs its loader in a worker thread
+MAX_CONCURRENT_URLS = 8
 
 
 URL_REGEX = re.compile(
@@ -25,6 +32,39 @@ URL_REGEX = re.compile(
     re.IGNORECASE,
 )
 
+# Output column -> document metadata key, in output order after "text"
+METADATA_COLUMNS = {
+    "url": "source",
+    "title": "title",
+    "description": "description",
+    "content_type": "content_type",
+    "language": "language",
+}
+
+# Elements whose content is not page text: code and templates, plus no-script fallbacks and navigation menus
+NON_TEXT_TAGS = ("script", "style", "template", "noscript", "nav")
+# Shared by every extraction; lxml parsers are reusable across documents
+_HTML_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_pis=True)
+
+
+def html_to_text(html: str) -> str:
+    """Extracts the text of an HTML page with lxml.
+
+    Args:
+        html: The page markup
+
+    Returns:
+        str: The concatenated text content of the page
+    """
+    try:
+        document = lxml.html.document_fromstring(html, parser=_HTML_PARSER)
+    except (etree.ParserError, ValueError):
+        # Empty pages and str input carrying an XML encoding declaration; BeautifulSoup copes with both
+        return BeautifulSoup(html, "lxml").get_text()
+    etree.strip_elements(document, *NON_TEXT_TAGS, with_tail=False)
+    return document.text_content()
+
+
 USER_AGENT = None
 # Check if langflow is installed using importlib.util.find_spec(name))
 if importlib.util.find_spec("langflow"):
@@ -35,6 +75,35 @@ else:
     USER_AGENT = "lfx"
 
 
+class HostLimitedUrlLoader(RecursiveUrlLoader):
+    """RecursiveUrlLoader whose async crawl caps the open connections per host.
+
+    The stock loader fans out to every child link at once, which lets a single site rate-limit the crawl into
+    minutes of timeouts. Here the whole crawl shares one session whose connector queues requests beyond
+    ``max_connections_per_host``.
+    """
+
+    def __init__(self, *args, max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_connections_per_host = max_connections_per_host
+
+    async def _async_get_child_links_recursive(self, url, visited, *, session=None, depth=0):
+        if session is not None or not self.use_async:
+            return await super()._async_get_child_links_recursive(url, visited, session=session, depth=depth)
+
+        connector = aiohttp.TCPConnector(
+            ssl=self.ssl,
+            limit_per_host=max(1, self.max_connections_per_host),
+            ttl_dns_cache=300,
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=self.headers,
+        ) as limited_session:
+            return await super()._async_get_child_links_recursive(url, visited, session=limited_session, depth=depth)
+
+
 class URLComponent(Component):
     """A component that loads and parses content from web pages recursively.
 
@@ -104,6 +173,17 @@ class URLComponent(Component):
             required=False,
             advanced=True,
         ),
+        IntInput(
+            name="max_connections_per_host",
+            display_name="Max Connections per Host",
+            info=(
+                "Maximum number of simultaneous requests to a single host when using async loading. "
+                "Lower values help avoid remote rate limits."
+            ),
+            value=DEFAULT_MAX_CONNECTIONS_PER_HOST,
+            required=False,
+            advanced=True,
+        ),
         DropdownInput(
             name="format",
             display_name="Output Format",
@@ -215,19 +295,19 @@ class URLComponent(Component):
 
         return url
 
-    def _create_loader(self, url: str) -> RecursiveUrlLoader:
+    def _create_loader(self, url: str) -> HostLimitedUrlLoader:
         """Creates a RecursiveUrlLoader instance with the configured settings.
 
         Args:
             url: The URL to load
 
         Returns:
-            RecursiveUrlLoader: Configured loader instance
+            HostLimitedUrlLoader: Configured loader instance
         """
         headers_dict = {header["key"]: header["value"] for header in self.headers if header["value"] is not None}
-        extractor = (lambda x: x) if self.format == "HTML" else (lambda x: BeautifulSoup(x, "lxml").get_text())
+        extractor = (lambda x: x) if self.format == "HTML" else html_to_text
 
-        return RecursiveUrlLoader(
+        return HostLimitedUrlLoader(
             url=url,
             max_depth=self.max_depth,
             prevent_outside=self.prevent_outside,
@@ -241,69 +321,85 @@ class URLComponent(Component):
             autoset_encoding=self.autoset_encoding,  # Enable automatic encoding detection
             exclude_dirs=[],  # Allow customization of excluded directories
             link_regex=None,  # Allow customization of link filtering
+            max_connections_per_host=self.max_connections_per_host,
         )
 
-    def fetch_url_contents(self) -> list[dict]:
-        """Load documents from the configured URLs.
+    def _load_url(self, url: str) -> list:
+        """Crawls a single root URL.
+
+        Args:
+            url: The root URL to crawl
 
         Returns:
-            List[Data]: List of Data objects containing the fetched content
+            list: The loaded documents, empty if the request failed or nothing was found
+        """
+        logger.debug(f"Loading documents from {url}")
+        try:
+            docs = self._create_loader(url).load()
+        except requests.exceptions.RequestException as e:
+            logger.exception(f"Error loading documents from {url}: {e}")
+            return []
+
+        if not docs:
+            logger.warning(f"No documents found for {url}")
+            return []
+
+        logger.debug(f"Found {len(docs)} documents from {url}")
+        return docs
+
+    def _as_columns(self) -> dict[str, list]:
+        """Crawls the configured URLs and collects the documents column by column.
+
+        Returns:
+            dict[str, list]: One list per output column, all of the same length
 
         Raises:
             ValueError: If no valid URLs are provided or if there's an error loading documents
         """
         try:
-            urls = list({self.ensure_url(url) for url in self.urls if url.strip()})
+            # dict.fromkeys drops duplicates while keeping the order the URLs were entered in
+            urls = list(dict.fromkeys(self.ensure_url(url) for url in self.urls if url.strip()))
             logger.debug(f"URLs: {urls}")
             if not urls:
                 msg = "No valid URLs provided."
                 raise ValueError(msg)
 
-            all_docs = []
-            for url in urls:
-                logger.debug(f"Loading documents from {url}")
-
-                try:
-                    loader = self._create_loader(url)
-                    docs = loader.load()
-
-                    if not docs:
-                        logger.warning(f"No documents found for {url}")
-                        continue
-
-                    logger.debug(f"Found {len(docs)} documents from {url}")
-                    all_docs.extend(docs)
-
-                except requests.exceptions.RequestException as e:
-                    logger.exception(f"Error loading documents from {url}: {e}")
-                    continue
-
-            if not all_docs:
+            texts: list[str] = []
+            meta_cols: dict[str, list] = {key: [] for key in METADATA_COLUMNS}
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_URLS, len(urls))) as executor:
+                for docs in executor.map(self._load_url, urls):
+                    for doc in docs:
+                        texts.append(safe_convert(doc.page_content, clean_data=True))
+                        metadata = doc.metadata
+                        for column, key in METADATA_COLUMNS.items():
+                            meta_cols[column].append(metadata.get(key, ""))
+
+            if not texts:
                 msg = "No documents were successfully loaded from any URL"
                 raise ValueError(msg)
-
-            # data = [Data(text=doc.page_content, **doc.metadata) for doc in all_docs]
-            data = [
-                {
-                    "text": safe_convert(doc.page_content, clean_data=True),
-                    "url": doc.metadata.get("source", ""),
-                    "title": doc.metadata.get("title", ""),
-                    "description": doc.metadata.get("description", ""),
-                    "content_type": doc.metadata.get("content_type", ""),
-                    "language": doc.metadata.get("language", ""),
-                }
-                for doc in all_docs
-            ]
         except Exception as e:
             error_msg = e.message if hasattr(e, "message") else e
             msg = f"Error loading documents: {error_msg!s}"
             logger.exception(msg)
             raise ValueError(msg) from e
-        return data
+        return {"text": texts, **meta_cols}
+
+    def fetch_url_contents(self) -> list[dict]:
+        """Load documents from the configured URLs.
+
+        Returns:
+            List[Data]: List of Data objects containing the fetched content
+
+        Raises:
+            ValueError: If no valid URLs are provided or if there's an error loading documents
+        """
+        columns = self._as_columns()
+        return [dict(zip(columns, row, strict=True)) for row in zip(*columns.values(), strict=True)]
 
     def fetch_content(self) -> DataFrame:
         """Convert the documents to a DataFrame."""
-        return DataFrame(data=self.fetch_url_contents())
+        # Built from the columns directly, skipping pandas' row-by-row inference for lists of dicts
+        return DataFrame(data=self._as_columns())
 
     def fetch_content_as_message(self) -> Message:
         """Convert the documents to a Message."""
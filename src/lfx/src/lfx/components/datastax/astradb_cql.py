@@ -1,10 +1,15 @@
+import copy
+import hashlib
 import json
-import urllib
+import threading
+import urllib.parse
 from datetime import datetime, timezone
+from functools import lru_cache
 from http import HTTPStatus
 from typing import Any
 
-import requests
+import httpx
+from cachetools import TTLCache
 from langchain_core.tools import StructuredTool, Tool
 from pydantic import BaseModel, Field, create_model
 
@@ -15,6 +20,30 @@ from lfx.log.logger import logger
 from lfx.schema.data import Data
 from lfx.schema.table import EditMode
 
+# Agents often repeat an identical tool call within a run, so successful reads are reused for a minute
+_REST_CACHE: TTLCache = TTLCache(maxsize=256, ttl=60)
+_REST_CACHE_LOCK = threading.Lock()
+# A truthy value under this key in the static filters or tool args skips the cache, for tables that change quickly
+VOLATILE_MARKER = "$volatile"
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Return the pooled client shared by every tool call, so repeat calls skip the TCP and TLS handshakes."""
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=64),
+        timeout=10.0,
+    )
+
+
+@lru_cache(maxsize=32)
+def projection_query(projection_fields: str) -> str:
+    """Return the ``&fields=`` query suffix for a projection, or an empty string when every column is selected."""
+    if projection_fields == "*":
+        return ""
+    return f"&fields={urllib.parse.quote(projection_fields.replace(' ', ''))}"
+
 
 class AstraDBCQLToolComponent(AstraDBBaseComponent, LCToolComponent):
     display_name: str = "Astra DB CQL"
@@ -124,7 +153,10 @@ class AstraDBCQLToolComponent(AstraDBBaseComponent, LCToolComponent):
             display_name="Static Filters",
             is_list=True,
             advanced=True,
-            info="Field name and value. When filled, it will not be generated by the LLM.",
+            info=(
+                "Field name and value. When filled, it will not be generated by the LLM. "
+                f"Set '{VOLATILE_MARKER}' to true to always query Astra DB instead of reusing recent results."
+            ),
         ),
         IntInput(
             name="number_of_results",
@@ -212,12 +244,20 @@ class AstraDBCQLToolComponent(AstraDBBaseComponent, LCToolComponent):
                 where[field_name] = {**where.get(field_name, {}), param["operator"]: field_value}
 
         url = f"{astra_url}?page-size={self.number_of_results}"
-        url += f"&where={json.dumps(where)}"
+        url += f"&where={urllib.parse.quote(json.dumps(where))}"
+        url += projection_query(self.projection_fields)
 
-        if self.projection_fields != "*":
-            url += f"&fields={urllib.parse.quote(self.projection_fields.replace(' ', ''))}"
+        volatile = bool(self.static_filters.get(VOLATILE_MARKER) or args.get(VOLATILE_MARKER))
+        cache_key = (url, hashlib.sha256(f"{self.token}".encode()).hexdigest())
+        cached = None
+        if not volatile:
+            with _REST_CACHE_LOCK:
+                cached = _REST_CACHE.get(cache_key)
+        if cached is not None:
+            # Callers wrap the rows in Data objects, so hand out a copy rather than the cached rows
+            return copy.deepcopy(cached)
 
-        res = requests.request("GET", url=url, headers=headers, timeout=10)
+        res = get_http_client().get(url, headers=headers)
 
         if int(res.status_code) >= HTTPStatus.BAD_REQUEST:
             msg = f"Error on Astra DB CQL Tool {self.tool_name} request: {res.text}"
@@ -226,10 +266,15 @@ class AstraDBCQLToolComponent(AstraDBBaseComponent, LCToolComponent):
 
         try:
             res_data = res.json()
-            return res_data["data"]
+            rows = res_data["data"]
         except ValueError:
             return res.status_code
 
+        if not volatile:
+            with _REST_CACHE_LOCK:
+                _REST_CACHE[cache_key] = copy.deepcopy(rows)
+        return rows
+
     def create_args_schema(self) -> dict[str, BaseModel]:
         args: dict[str, tuple[Any, Field]] = {}
 
@@ -1,5 +1,7 @@
+from string import Formatter
+
 from lfx.custom.custom_component.component import Component
-from lfx.helpers.data import safe_convert
+from lfx.helpers.data import clean_string, safe_convert
 from lfx.inputs.inputs import BoolInput, HandleInput, MessageTextInput, MultilineInput, TabInput
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
@@ -117,10 +119,12 @@ class ParserComponent(Component):
         df, data = self._clean_args()
 
         lines = []
-        if df is not None:
-            for _, row in df.iterrows():
-                formatted_text = self.pattern.format(**row.to_dict())
-                lines.append(formatted_text)
+        if df is not None and not any(field is not None for _, field, _, _ in Formatter().parse(self.pattern)):
+            # A template without placeholders renders the same for every row, so format it once
+            lines = [self.pattern.format()] * len(df)
+        elif df is not None:
+            # Records keep each column's own type, where iterrows() would build a Series per row and upcast ints
+            lines = [self.pattern.format(**record) for record in df.to_dict(orient="records")]
         elif data is not None:
             # Use format_map with a dict that returns default_value for missing keys
             class DefaultDict(dict):
@@ -138,7 +142,14 @@ class ParserComponent(Component):
         """Convert input data to string with proper error handling."""
         result = ""
         if isinstance(self.input_data, list):
-            result = "\n".join([safe_convert(item, clean_data=self.clean_data or False) for item in self.input_data])
+            clean_data = self.clean_data or False
+            # Plain strings only need the cleanup safe_convert would give them, without its type dispatch
+            result = "\n".join(
+                [
+                    clean_string(item) if type(item) is str else safe_convert(item, clean_data=clean_data)
+                    for item in self.input_data
+                ]
+            )
         else:
             result = safe_convert(self.input_data or False)
         self.log(f"Converted to string with length: {len(result)}")
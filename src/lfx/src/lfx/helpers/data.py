@@ -23,11 +23,19 @@ def docs_to_data(documents: list[Document]) -> list[Data]:
     return [Data.from_document(document) for document in documents]
 
 
+# Compiled once: clean_string runs per item and the DataFrame patterns are applied to every cell
+_BLANK_LINE_RE = re.compile(r"^\s*$", flags=re.MULTILINE)
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+_BLANK_CELL_RE = re.compile(r"^\s*$")
+_NEWLINES_RE = re.compile(r"\n+")
+_PIPE_RE = re.compile(r"\|")
+
+
 def clean_string(s):
     # Remove empty lines
-    s = re.sub(r"^\s*$", "", s, flags=re.MULTILINE)
+    s = _BLANK_LINE_RE.sub("", s)
     # Replace three or more newlines with a double newline
-    return re.sub(r"\n{3,}", "\n\n", s)
+    return _EXCESS_NEWLINES_RE.sub("\n\n", s)
 
 
 def _serialize_data(data: Data) -> str:
@@ -54,12 +62,12 @@ def safe_convert(data: Any, *, clean_data: bool = False) -> str:
                 # Remove empty rows
                 data = data.dropna(how="all")
                 # Remove empty lines in each cell
-                data = data.replace(r"^\s*$", "", regex=True)
+                data = data.replace(_BLANK_CELL_RE, "", regex=True)
                 # Replace multiple newlines with a single newline
-                data = data.replace(r"\n+", "\n", regex=True)
+                data = data.replace(_NEWLINES_RE, "\n", regex=True)
 
             # Replace pipe characters to avoid markdown table issues
-            processed_data = data.replace(r"\|", r"\\|", regex=True)
+            processed_data = data.replace(_PIPE_RE, r"\\|", regex=True)
 
             return processed_data.to_markdown(index=False)
 
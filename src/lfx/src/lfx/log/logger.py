@@ -338,10 +338,12 @@ def configure(
             max_bytes = 10 * 1024 * 1024  # Default 10MB
 
         # Since structlog doesn't have built-in rotation, we'll use stdlib logging for file output
+        # delay=True defers opening the file until the first record is emitted
         file_handler = logging.handlers.RotatingFileHandler(
             log_file,
             maxBytes=max_bytes,
             backupCount=5,
+            delay=True,
         )
         file_handler.setFormatter(logging.Formatter("%(message)s"))
 
@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from lfx.schema.artifact import ArtifactType, get_artifact_type, post_process_raw
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+from lfx.schema.encoders import CUSTOM_ENCODERS
+from lfx.schema.message import Message
+from pydantic import BaseModel
+
+
+class TextSubclass(str):
+    __slots__ = ()
+
+
+class Event(BaseModel):
+    name: str
+    at: datetime
+
+
+class TestGetArtifactType:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("hello", ArtifactType.TEXT),
+            ({"key": "value"}, ArtifactType.OBJECT),
+            ([1, 2, 3], ArtifactType.ARRAY),
+            (DataFrame({"a": [1]}), ArtifactType.ARRAY),
+            (Message(text="hello"), ArtifactType.MESSAGE),
+            (Data(data={"key": "value"}), ArtifactType.OBJECT),
+            (42, ArtifactType.UNKNOWN),
+            (None, ArtifactType.UNKNOWN),
+        ],
+    )
+    def test_exact_types(self, value, expected):
+        assert get_artifact_type(value) == expected.value
+
+    def test_subclass_falls_back_to_isinstance(self):
+        assert get_artifact_type(TextSubclass("hello")) == ArtifactType.TEXT.value
+
+    def test_generator_build_result_is_stream(self):
+        def generate():
+            yield "chunk"
+
+        assert get_artifact_type(42, build_result=generate()) == ArtifactType.STREAM.value
+
+
+class TestPostProcessRaw:
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            {"a": 1, "b": [1, 2.5, None, True], "c": {"d": "x"}},
+            {"at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), "fn": len},
+            Event(name="launch", at=datetime(2024, 1, 2, tzinfo=timezone.utc)),
+            {"event": Event(name="launch", at=datetime(2024, 1, 2, tzinfo=timezone.utc))},
+            # orjson rejects these, so they take the jsonable_encoder fallback
+            {1: "int key"},
+            {"tags": {"a"}, "payload": b"bytes"},
+        ],
+    )
+    def test_unknown_object_matches_jsonable_encoder(self, raw):
+        processed, artifact_type = post_process_raw(raw, ArtifactType.UNKNOWN.value)
+
+        assert artifact_type == ArtifactType.OBJECT.value
+        assert processed == jsonable_encoder(raw, custom_encoder=CUSTOM_ENCODERS)
+
+    def test_unknown_other_value_gets_default_message(self):
+        processed, artifact_type = post_process_raw(42, ArtifactType.UNKNOWN.value)
+
+        assert processed == "Built Successfully ✨"
+        assert artifact_type == ArtifactType.UNKNOWN.value
+
+    def test_array_serializes_models_and_stringifies_the_rest(self):
+        raw = [Data(data={"a": 1}), 2, "three"]
+
+        processed, artifact_type = post_process_raw(raw, ArtifactType.ARRAY.value)
+
+        assert artifact_type == ArtifactType.ARRAY.value
+        assert processed == [{"text_key": "text", "data": {"a": 1}, "default_value": ""}, "2", "three"]
+
+    def test_array_of_one_type(self):
+        processed, _ = post_process_raw([1, 2, 3], ArtifactType.ARRAY.value)
+
+        assert processed == ["1", "2", "3"]